@@ -46,17 +46,27 @@ _LAZY_EXPORTS = {
     "SutherlandFitting": ".transport",
     "WSGGRadlibBordbar2020": ".transport",
 
+    # diffusion:
+    "DiffusionBatchCase": ".diffusion",
+    "DiffusionBatchRunner": ".diffusion",
+
     # vision:
     "ImageCrop": ".vision",
     "CropGuidesDisplay": ".vision",
     "ChannelSelector": ".vision",
     "ContrastEnhancement": ".vision",
     "ThresholdImage": ".vision",
+    "ChunkedImageStore": ".vision",
+    "ImagePipeline": ".vision",
     "LabelizeRegions": ".vision",
     "HelpersFFT": ".vision",
     "AbstractSEMImageLoader": ".vision",
     "HyperSpySEMImageLoaderStub": ".vision",
+    "LazySEMImageLoader": ".vision",
+    "TiledImage": ".vision",
     "CharacteristicLengthSEMImage": ".vision",
+    "CharacteristicLengthEngine": ".vision",
+    "ImageMetadataIndex": ".vision",
     "load_metadata": ".vision",
     "metadata_exifread": ".vision",
     "metadata_pil": ".vision",
@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+import re
+import subprocess
+import sys
+import tomllib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from os import cpu_count
+from pathlib import Path
+from time import perf_counter
+
+import pandas as pd
+from ruamel.yaml import YAML
+
+# XXX: the Rust solver writes directly to the process standard output
+# and keeps its Lua state in thread-local storage, thus each case runs
+# in its own interpreter so that logs are isolated and cases are truly
+# concurrent (the extension does not release the GIL while solving).
+_SOLVER_COMMAND = ("import sys; "
+                   "from majordome._core import diffusion_solver; "
+                   "diffusion_solver(sys.argv[1:])")
+
+# Any log line carrying numbers (other than the banner) is taken as a
+# progress record of the integrator; its format belongs to the solver
+# crate, thus only the numeric fields are kept in the results table.
+_NUMBER = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+
+
+@dataclass
+class DiffusionBatchCase:
+    """ Single case entry of a diffusion solver batch manifest.
+
+    Parameters
+    ----------
+    name : str
+        Unique name of the case, used for naming its output files.
+    script : Path
+        Path to the Lua setup script consumed by `diffusion_solver`.
+    """
+    name: str
+    script: Path
+
+
+class DiffusionBatchRunner:
+    """ Run a manifest of `diffusion_solver` cases concurrently.
+
+    The manifest is a TOML or YAML file providing a list of `cases`,
+    each with a `name` and a `script` (relative to the manifest), and
+    optionally the default number of `workers` and `output` directory.
+
+    ```toml
+    workers = 4
+    output = "results"
+
+    [[cases]]
+    name = "case-01"
+    script = "setups/case-01.lua"
+    ```
+
+    Parameters
+    ----------
+    manifest : str | Path
+        Path to the manifest file (`.toml`, `.yaml` or `.yml`).
+    workers : int | None = None
+        Number of cases run simultaneously; if not provided, the value
+        from the manifest is used, otherwise the number of CPUs.
+    output : str | Path | None = None
+        Directory where case logs, results and summary are written,
+        relative to the current working directory; if not provided, the
+        manifest `output` entry (relative to the manifest) or
+        `batch-results` next to the manifest is used.
+    """
+    __slots__ = ("_root", "_cases", "_workers", "_output", "_summary")
+
+    def __init__(self,
+            manifest: str | Path,
+            workers: int | None = None,
+            output: str | Path | None = None
+        ) -> None:
+        if not (manifest := Path(manifest)).is_file():
+            raise FileNotFoundError(f"Manifest not found: {manifest}")
+
+        self._root = manifest.resolve().parent
+        config = self._load_manifest(manifest)
+
+        if workers is None:
+            workers = config.get("workers")
+
+        if workers is None:
+            workers = cpu_count() or 1
+
+        if workers < 1:
+            raise ValueError(f"Number of workers must be positive "
+                             f"({workers})")
+
+        # Explicit paths follow the usual convention of being relative
+        # to the working directory, manifest entries to the manifest.
+        if output is None:
+            output = self._root / config.get("output", "batch-results")
+
+        self._workers = int(workers)
+        self._output = Path(output).resolve()
+        self._cases = self._get_cases(config.get("cases", []))
+
+    @staticmethod
+    def _load_manifest(manifest):
+        match manifest.suffix.lower():
+            case ".toml":
+                with open(manifest, "rb") as fp:
+                    return tomllib.load(fp)
+            case ".yaml" | ".yml":
+                with open(manifest) as fp:
+                    return YAML(typ="safe").load(fp)
+            case _:
+                raise ValueError(f"Unsupported manifest format "
+                                 f"'{manifest.suffix}'")
+
+    def _get_cases(self, entries):
+        if not entries:
+            raise ValueError("Manifest does not declare any `cases`.")
+
+        cases = []
+
+        for entry in entries:
+            script = self._root / entry["script"]
+            name = entry.get("name", script.stem)
+
+            if not script.is_file():
+                raise FileNotFoundError(f"Case script not found: {script}")
+
+            cases.append(DiffusionBatchCase(name=name, script=script))
+
+        names = [case.name for case in cases]
+
+        if len(set(names)) != len(names):
+            raise ValueError("Case names in manifest must be unique.")
+
+        return cases
+
+    def _run_case(self, case):
+        log_file = self._output / f"{case.name}.log"
+        command = [sys.executable, "-c", _SOLVER_COMMAND, str(case.script)]
+
+        t0 = perf_counter()
+
+        with open(log_file, "w") as fp:
+            result = subprocess.run(command, cwd=self._root, stdout=fp,
+                                    stderr=subprocess.STDOUT)
+
+        runtime = perf_counter() - t0
+
+        with open(log_file) as fp:
+            lines = [line.strip() for line in fp if line.strip()]
+
+        progress = self._parse_progress(lines)
+        results_file = self._output / f"{case.name}.parquet"
+        progress.to_parquet(results_file)
+
+        return {
+            "name": case.name,
+            "script": str(case.script),
+            "status": "ok" if result.returncode == 0 else "failed",
+            "return_code": result.returncode,
+            "runtime_s": runtime,
+            "log_lines": len(lines),
+            "last_message": lines[-1] if lines else "",
+            "progress_records": len(progress),
+            "final_progress": (progress["values"].iloc[-1]
+                               if len(progress) else []),
+            "log_file": str(log_file),
+            "results_file": str(results_file),
+        }
+
+    @staticmethod
+    def _parse_progress(lines):
+        records = []
+
+        for line in lines:
+            if line.startswith("Majordome"):
+                continue
+
+            if values := [float(v) for v in _NUMBER.findall(line)]:
+                records.append({"step": len(records), "message": line,
+                                "values": values})
+
+        return pd.DataFrame(records, columns=["step", "message", "values"])
+
+    def run(self) -> pd.DataFrame:
+        """ Run all cases and write the results tables to Parquet.
+
+        Besides its log, each case gets a `<name>.parquet` table with
+        the numeric fields of the solver progress records; the summary
+        gathers status, runtime and convergence statistics per case.
+
+        Returns
+        -------
+        pd.DataFrame
+            Summary table with status and runtime statistics per case.
+        """
+        self._output.mkdir(parents=True, exist_ok=True)
+
+        with ThreadPoolExecutor(max_workers=self._workers) as pool:
+            rows = list(pool.map(self._run_case, self._cases))
+
+        self._summary = pd.DataFrame(rows)
+        self._summary.to_parquet(self._output / "summary.parquet")
+
+        return self._summary
+
+    @property
+    def cases(self) -> list[DiffusionBatchCase]:
+        """ Provides access to the list of cases in the manifest. """
+        return self._cases
+
+    @property
+    def workers(self) -> int:
+        """ Provides access to the number of concurrent workers. """
+        return self._workers
+
+    @property
+    def output_directory(self) -> Path:
+        """ Provides access to the results directory. """
+        return self._output
+
+    @property
+    def summary(self) -> pd.DataFrame:
+        """ Provides access to the summary of the last run. """
+        if not hasattr(self, "_summary"):
+            raise AttributeError("No summary available, call `run` first.")
+
+        return self._summary
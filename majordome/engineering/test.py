@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+import pytest
+
 from majordome.engineering import (
     SolutionDimless,
     PlugFlowChainCantera,
@@ -9,3 +11,126 @@ def test_lazy_imports():
     assert SolutionDimless is not None
     assert PlugFlowChainCantera is not None
     assert ImageCrop is not None
+
+
+def test_diffusion_batch_runner_arguments(tmp_path, monkeypatch):
+    from majordome.engineering.diffusion import DiffusionBatchRunner
+
+    (tmp_path / "case.lua").write_text("")
+    manifest = tmp_path / "batch.toml"
+    manifest.write_text('workers = 3\n\n[[cases]]\nscript = "case.lua"\n')
+
+    with pytest.raises(ValueError):
+        DiffusionBatchRunner(manifest, workers=0)
+
+    monkeypatch.chdir(tmp_path / "..")
+    runner = DiffusionBatchRunner(manifest, output="results")
+
+    assert runner.workers == 3
+    assert runner.output_directory == (tmp_path / ".." / "results").resolve()
+    assert DiffusionBatchRunner(manifest).output_directory == \
+        (tmp_path / "batch-results").resolve()
+
+    progress = DiffusionBatchRunner._parse_progress([
+        "Majordome Diffusion Standalone Lua CLI Solver",
+        "t = 7.2e+02 s, residual 1.5E-3",
+        "Generating output plot at: result.png",
+        "t = 1440 s, residual .25",
+    ])
+    assert progress["step"].tolist() == [0, 1]
+    assert progress["values"].tolist() == [[720.0, 1.5e-3], [1440.0, 0.25]]
+
+
+def test_image_pipeline_resume(tmp_path):
+    import numpy as np
+    from majordome.engineering import (
+        ChunkedImageStore,
+        ContrastEnhancement,
+        ImagePipeline,
+    )
+
+    rng = np.random.default_rng(42)
+    stack = rng.random((11, 16, 16))
+
+    def pipeline():
+        return ImagePipeline(contrast=ContrastEnhancement.STRETCHING,
+                             contrast_kw={"percentiles": (2, 98)})
+
+    store = pipeline().run(stack[:8], tmp_path, chunk_size=4)
+    assert store.n_chunks == 2
+
+    # Same configuration resumes, although tuples are stored as lists:
+    with pytest.raises(ValueError):
+        pipeline().run(stack, tmp_path, chunk_size=3)
+
+    with pytest.raises(ValueError):
+        pipeline().run(stack, tmp_path, chunk_size=4)
+
+    store = pipeline().run(stack[:8], ChunkedImageStore(tmp_path),
+                           chunk_size=4)
+    assert store.names == [str(k) for k in range(8)]
+
+    expected = pipeline().apply_stack(stack[:8])
+    result = np.concatenate([store.load_chunk(k) for k in range(2)])
+    assert np.allclose(result, expected)
+
+
+def test_tiled_image_global_operations():
+    import numpy as np
+    from skimage import filters, measure
+    from majordome.engineering import ThresholdImage, TiledImage
+
+    rng = np.random.default_rng(42)
+    img = rng.random((150, 120))
+    tiles = TiledImage(img, tile=32, overlap=4)
+
+    level = filters.threshold_otsu(img)
+    assert tiles.otsu_threshold() == level
+    assert np.array_equal(tiles.threshold(ThresholdImage.OTSU), img > level)
+
+    mask = img > 0.6
+    labels = TiledImage(mask, tile=32).label()
+    assert labels.max() == measure.label(mask, connectivity=2).max()
+
+
+def test_local_thresholds_match_skimage():
+    import numpy as np
+    from skimage import filters
+    from majordome.engineering import ThresholdImage
+
+    rng = np.random.default_rng(42)
+    img = filters.gaussian(rng.random((200, 160)), sigma=2)
+
+    for method, reference in [
+            (ThresholdImage.SAUVOLA, filters.threshold_sauvola),
+            (ThresholdImage.NIBLACK, filters.threshold_niblack),
+        ]:
+        mask = method.apply(img, window_size=25, k=0.2)
+        expected = img > reference(img, window_size=25, k=0.2)
+        assert np.array_equal(mask, expected)
+
+    # Two-level stripes are split within every block:
+    stripes = np.tile(np.repeat([False, True], 8), (64, 8))
+    img = np.where(stripes, 0.8, 0.2)
+    mask = ThresholdImage.LOCAL_OTSU.apply(img, window_size=33)
+    assert np.array_equal(mask, stripes)
+
+    # Flat images and flat blocks have no foreground:
+    flat = np.full((64, 65), 0.5)
+    assert not ThresholdImage.LOCAL_OTSU.apply(flat, window_size=33).any()
+
+    img = np.hstack([flat, np.where(stripes[:, :63], 1.0, 0.6)])
+    img[0, -1] = 0.0
+    mask = ThresholdImage.LOCAL_OTSU.apply(img, window_size=65)
+    assert not mask[:, :65].any()
+
+
+def test_characteristic_length_constant_image():
+    import numpy as np
+    from majordome.engineering import CharacteristicLengthEngine
+
+    engine = CharacteristicLengthEngine(nbins=16, window=False)
+    table = engine.orientation_table(np.ones((32, 32)), 1.0, nangles=6)
+
+    assert np.all(table["Power fraction"] == 0.0)
+    assert engine.anisotropy(table) == (0.0, 0.0)
@@ -1,18 +1,28 @@
 # -*- coding: utf-8 -*-
+import contextlib
+import json
+import re
+import threading
 import warnings
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from enum import Enum, StrEnum, auto
 from numbers import Number
 from pathlib import Path
+from typing import Any, Callable, Iterator, Self
 
 import exifread
 import numpy as np
 import pandas as pd
+import tifffile
 from matplotlib import pyplot as plt
 from matplotlib.figure import Figure
 from numpy.typing import NDArray
 from PIL import ExifTags, Image, ImageDraw
 from scipy.integrate import cumulative_simpson, simpson
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
 from skimage import (
     color,
     exposure,
@@ -20,6 +30,7 @@ from skimage import (
     measure,
     morphology,
     segmentation,
+    transform,
     io as skio,
     util as skutil,
 )
@@ -283,9 +294,20 @@ class ContrastEnhancement(StrEnum):
 
 
 class ThresholdImage(StrEnum):
-    """ Enumeration for image thresholding methods. """
-    MANUAL = auto()
-    OTSU   = auto()
+    """ Enumeration for image thresholding methods.
+
+    Local methods (SAUVOLA, NIBLACK, LOCAL_OTSU) accept the keywords
+    `window_size` (odd, default 25 pixels) and `scale` (default 1); for
+    `scale > 1` the threshold surface is computed over an image reduced
+    by block averaging and bilinearly upsampled back. SAUVOLA and NIBLACK
+    further accept `k` (default 0.2) and SAUVOLA the dynamic range `r`
+    (default to half the data type range, as in `skimage.filters`).
+    """
+    MANUAL     = auto()
+    OTSU       = auto()
+    SAUVOLA    = auto()
+    NIBLACK    = auto()
+    LOCAL_OTSU = auto()
 
     # NOTE: we intentionally don't define a `verbose` attribute here because
     # attributes in Enum bodies become enum members. Instead we provide a
@@ -316,6 +338,126 @@ class ThresholdImage(StrEnum):
 
         return img > threshold
 
+    @staticmethod
+    def _window_stats(img, window_size):
+        """ Local mean and standard deviation through integral images. """
+        h = window_size // 2
+        w = 2 * h + 1
+
+        # Centering reduces cancellation in the variance evaluation:
+        center = float(img.mean())
+        padded = np.pad(img.astype(np.float64), h, mode="reflect")
+        padded -= center
+
+        # Integral image with a leading row/column of zeros so that any
+        # window sum is a combination of four corners, O(1) per pixel.
+        S = np.zeros((padded.shape[0] + 1, padded.shape[1] + 1))
+
+        def box_mean(x):
+            np.cumsum(x, axis=0, out=S[1:, 1:])
+            np.cumsum(S[1:, 1:], axis=1, out=S[1:, 1:])
+
+            out = S[w:, w:] - S[:-w, w:]
+            out -= S[w:, :-w]
+            out += S[:-w, :-w]
+            out /= w * w
+            return out
+
+        mean = box_mean(padded)
+
+        np.multiply(padded, padded, out=padded)
+        var = box_mean(padded)
+        var -= mean * mean
+
+        np.clip(var, 0, None, out=var)
+        mean += center
+
+        return mean, np.sqrt(var, out=var)
+
+    @staticmethod
+    def _otsu_blocks(img, window_size, nbins=256):
+        """ Otsu thresholds of all blocks from a single histogram pass. """
+        vmin, vmax = float(img.min()), float(img.max())
+
+        if vmax <= vmin:
+            return np.full((1, 1), vmin)
+
+        q = (img - vmin) * ((nbins - 1) / (vmax - vmin))
+        q = np.rint(q).astype(np.intp)
+
+        H, W = img.shape
+        nby = -(-H // window_size)
+        nbx = -(-W // window_size)
+
+        rows = np.arange(H) // window_size
+        cols = np.arange(W) // window_size
+        blocks = rows[:, np.newaxis] * nbx + cols[np.newaxis, :]
+
+        hist = np.bincount((blocks * nbins + q).ravel(),
+                           minlength=nby * nbx * nbins)
+        hist = hist.reshape(nby * nbx, nbins).astype(np.float64)
+
+        levels = np.arange(nbins, dtype=np.float64)
+        w0 = np.cumsum(hist, axis=1)
+        m0 = np.cumsum(hist * levels, axis=1)
+        w1 = w0[:, -1:] - w0
+        m1 = m0[:, -1:] - m0
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            between = w0 * w1 * (m0 / w0 - m1 / w1)**2
+
+        between = np.nan_to_num(between, nan=-1.0)
+        threshold = np.argmax(between[:, :-1], axis=1).astype(np.float64)
+
+        # Uniform blocks have no between-class variance; their level is
+        # set at the upper edge of the only bin, thus all background:
+        uniform = np.count_nonzero(hist, axis=1) == 1
+        threshold[uniform] = np.argmax(hist[uniform], axis=1) + 0.5
+
+        levels = vmin + threshold * (vmax - vmin) / (nbins - 1)
+        return levels.reshape(nby, nbx)
+
+    def _local(self, img: NDArray, **kw) -> NDArray:
+        window_size = int(kw.get("window_size", 25))
+        scale = int(kw.get("scale", 1))
+
+        if window_size < 3 or window_size % 2 == 0:
+            raise ValueError(f"Window size must be odd and at least 3 "
+                             f"({window_size})")
+
+        work = img
+
+        if scale > 1:
+            work = transform.downscale_local_mean(img, (scale, scale))
+            window_size = max(3, (window_size // scale) | 1)
+
+        match self:
+            case ThresholdImage.SAUVOLA:
+                k = kw.get("k", 0.2)
+                r = kw.get("r", None)
+
+                if r is None:
+                    imin, imax = skutil.dtype_limits(img,
+                                                     clip_negative=False)
+                    r = 0.5 * (imax - imin)
+
+                surface, s = self._window_stats(work, window_size)
+                s *= k / r
+                s += 1 - k
+                surface *= s
+            case ThresholdImage.NIBLACK:
+                k = kw.get("k", 0.2)
+                surface, s = self._window_stats(work, window_size)
+                surface -= k * s
+            case ThresholdImage.LOCAL_OTSU:
+                surface = self._otsu_blocks(work, window_size)
+
+        if surface.shape != img.shape:
+            surface = transform.resize(surface, img.shape, order=1,
+                                       mode="edge", anti_aliasing=False)
+
+        return img > surface
+
     def apply(self, img: NDArray, **kw) -> NDArray:
         """ Apply thresholding to the input image. """
         match self:
@@ -323,6 +465,8 @@ class ThresholdImage(StrEnum):
                 img = self._manual(img, kw.get("threshold", 0.0))
             case ThresholdImage.OTSU:
                 img = self._otsu(img)
+            case _:
+                img = self._local(img, **kw)
 
         return img
 
@@ -332,6 +476,286 @@ class ThresholdImage(StrEnum):
         return [entry.name for entry in cls]
 
 
+class ChunkedImageStore:
+    """ Directory of `.npy` chunks written incrementally by a pipeline.
+
+    Each chunk is stored as a stacked array `chunk-XXXXXX.npy` and the
+    file names of the images it contains are kept in `index.json`, so
+    that an interrupted run can be resumed from the last chunk written.
+
+    Parameters
+    ----------
+    path : str | Path
+        Directory of the store; created if it does not exist.
+    """
+    __slots__ = ("_path", "_index")
+
+    def __init__(self, path: str | Path) -> None:
+        self._path = Path(path)
+        self._path.mkdir(parents=True, exist_ok=True)
+        self._index = {"config": None, "chunks": {}}
+
+        if (index_file := self._path / "index.json").exists():
+            with open(index_file) as fp:
+                self._index = json.load(fp)
+
+    def _chunk_file(self, k):
+        return self._path / f"chunk-{k:06d}.npy"
+
+    def _write_index(self):
+        # Write-then-rename so that the index is never left truncated.
+        tmp = self._path / "index.json.tmp"
+
+        with open(tmp, "w") as fp:
+            json.dump(self._index, fp, indent=2)
+
+        tmp.replace(self._path / "index.json")
+
+    def check_config(self, config: dict) -> None:
+        """ Register pipeline configuration or check it on resume. """
+        # Compare in stored form, e.g. tuples are loaded back as lists.
+        config = json.loads(json.dumps(config))
+
+        if self._index["config"] is None:
+            self._index["config"] = config
+            self._write_index()
+            return
+
+        if self._index["config"] != config:
+            raise ValueError(f"Store {self._path} was created with another"
+                             f" pipeline configuration, chunk size or list"
+                             f" of source images; use a new path.")
+
+    def has_chunk(self, k: int) -> bool:
+        """ Check whether chunk `k` has been completely written. """
+        return str(k) in self._index["chunks"]
+
+    def write_chunk(self, k: int, names: list[str], data: NDArray) -> None:
+        """ Write chunk `k` and register the names of its images. """
+        tmp = self._path / f"chunk-{k:06d}.tmp.npy"
+        np.save(tmp, data)
+        tmp.replace(self._chunk_file(k))
+
+        self._index["chunks"][str(k)] = list(names)
+        self._write_index()
+
+    def load_chunk(self, k: int, mmap: bool = True) -> NDArray:
+        """ Load chunk `k`, memory-mapped (read-only) by default. """
+        if not self.has_chunk(k):
+            raise KeyError(f"Chunk {k} not available in {self._path}")
+
+        return np.load(self._chunk_file(k), mmap_mode="r" if mmap else None)
+
+    @property
+    def path(self) -> Path:
+        """ Provides access to the store directory. """
+        return self._path
+
+    @property
+    def n_chunks(self) -> int:
+        """ Provides access to the number of chunks written. """
+        return len(self._index["chunks"])
+
+    @property
+    def names(self) -> list[str]:
+        """ Provides access to image names in storage order. """
+        chunks = self._index["chunks"]
+        return [n for k in sorted(chunks, key=int) for n in chunks[k]]
+
+
+class ImagePipeline:
+    """ Composable chain of processing steps applied to image stacks.
+
+    Steps are applied in the order crop, channel selection, contrast
+    enhancement, and thresholding; any step set to None is skipped.
+    Cropping and channel selection are applied to whole stacks at once,
+    while contrast and thresholding are dispatched per image to a pool
+    of threads (the underlying NumPy/scikit-image kernels release the
+    GIL for most of their work).
+
+    Parameters
+    ----------
+    crop : ImageCrop | None = None
+        Region of interest applied to all images.
+    channel : ChannelSelector | None = None
+        Channel to select from RGB(A) images; ignored for 2-D images.
+    contrast : ContrastEnhancement | None = None
+        Contrast enhancement method.
+    threshold : ThresholdImage | None = None
+        Thresholding method producing binary masks.
+    contrast_kw : dict | None = None
+        Keyword arguments forwarded to `ContrastEnhancement.apply`.
+    threshold_kw : dict | None = None
+        Keyword arguments forwarded to `ThresholdImage.apply`.
+    """
+    __slots__ = ("_crop", "_channel", "_contrast", "_threshold",
+                 "_contrast_kw", "_threshold_kw")
+
+    def __init__(self, *,
+            crop: ImageCrop | None = None,
+            channel: ChannelSelector | None = None,
+            contrast: ContrastEnhancement | None = None,
+            threshold: ThresholdImage | None = None,
+            contrast_kw: dict | None = None,
+            threshold_kw: dict | None = None
+        ) -> None:
+        self._crop = crop
+        self._channel = channel
+        self._contrast = contrast
+        self._threshold = threshold
+        self._contrast_kw = contrast_kw or {}
+        self._threshold_kw = threshold_kw or {}
+
+    def _select(self, stack):
+        """ Apply channel selection to a stack of shape (n, h, w[, c]). """
+        if self._channel is None or stack.ndim == 3:
+            return stack
+
+        if self._channel is ChannelSelector.GRAY:
+            return color.rgb2gray(stack[..., :3])
+
+        return stack[..., self._channel.value]
+
+    def _per_image(self, img):
+        if self._contrast is not None:
+            img = self._contrast.apply(img, **self._contrast_kw)
+
+        if self._threshold is not None:
+            img = self._threshold.apply(img, **self._threshold_kw)
+
+        return img
+
+    def apply(self, img: NDArray) -> NDArray:
+        """ Apply the pipeline to a single 2-D (or RGB) image. """
+        return self.apply_stack(img[np.newaxis], workers=1)[0]
+
+    def apply_stack(self, stack: NDArray, workers: int | None = None
+                    ) -> NDArray:
+        """ Apply the pipeline to a stack of images.
+
+        Parameters
+        ----------
+        stack : NDArray
+            Array of shape (n, h, w) or (n, h, w, c) of images.
+        workers : int | None = None
+            Number of threads for per-image steps; if None, uses the
+            default of `ThreadPoolExecutor`.
+
+        Returns
+        -------
+        NDArray
+            Stack of processed images with shape (n, h', w').
+        """
+        if self._crop is not None:
+            x0, y0, x1, y1 = self._crop.get_coords(stack[0])
+            stack = stack[:, y0:y1, x0:x1]
+
+        stack = self._select(stack)
+
+        if self._contrast is None and self._threshold is None:
+            return stack
+
+        if workers == 1:
+            return np.stack([self._per_image(img) for img in stack])
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return np.stack(list(pool.map(self._per_image, stack)))
+
+    def to_dict(self) -> dict:
+        """ Convert the pipeline configuration to a dictionary. """
+        def name_or_none(step):
+            return None if step is None else step.name
+
+        return {
+            "crop": None if self._crop is None else self._crop.to_dict(),
+            "channel": name_or_none(self._channel),
+            "contrast": name_or_none(self._contrast),
+            "threshold": name_or_none(self._threshold),
+            "contrast_kw": self._contrast_kw,
+            "threshold_kw": self._threshold_kw,
+        }
+
+    def run(self,
+            source: str | Path | list[Path] | NDArray,
+            store: str | Path | ChunkedImageStore,
+            *,
+            pattern: str = "*.tif",
+            chunk_size: int = 64,
+            workers: int | None = None
+        ) -> ChunkedImageStore:
+        """ Process a directory or stack chunk-wise into a store.
+
+        Only one chunk of images is held in memory at a time; chunks
+        already present in the store are skipped, so that calling this
+        again after an interruption resumes the processing. Resuming
+        requires the same pipeline, chunk size and source images.
+
+        Parameters
+        ----------
+        source : str | Path | list[Path] | NDArray
+            Directory of images (filtered by `pattern`), list of image
+            files, or a stack of shape (n, h, w[, c]).
+        store : str | Path | ChunkedImageStore
+            Destination store or its directory.
+        pattern : str = "*.tif"
+            Glob pattern used when `source` is a directory.
+        chunk_size : int = 64
+            Number of images per chunk.
+        workers : int | None = None
+            Number of threads used for loading and processing.
+
+        Returns
+        -------
+        ChunkedImageStore
+            The store holding the processed chunks.
+        """
+        if chunk_size < 1:
+            raise ValueError(f"Chunk size must be positive ({chunk_size})")
+
+        if not isinstance(store, ChunkedImageStore):
+            store = ChunkedImageStore(store)
+
+        if isinstance(source, np.ndarray):
+            names = [str(k) for k in range(source.shape[0])]
+        elif isinstance(source, (str, Path)):
+            source = sorted(Path(source).glob(pattern))
+            names = [f.name for f in source]
+        else:
+            source = [Path(f) for f in source]
+            names = [f.name for f in source]
+
+        # Chunk numbering is only meaningful for the same split of the
+        # same sources, thus both are part of the resume key.
+        store.check_config({"pipeline": self.to_dict(),
+                            "chunk_size": chunk_size, "names": names})
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for k, start in enumerate(range(0, len(names), chunk_size)):
+                if store.has_chunk(k):
+                    continue
+
+                end = start + chunk_size
+
+                if isinstance(source, np.ndarray):
+                    chunk = source[start:end]
+                else:
+                    chunk = self._stack(pool.map(skio.imread,
+                                                 source[start:end]))
+
+                chunk = self.apply_stack(chunk, workers=workers)
+                store.write_chunk(k, names[start:end], chunk)
+
+        return store
+
+    @staticmethod
+    def _stack(images):
+        try:
+            return np.stack(list(images))
+        except ValueError as err:
+            raise ValueError("All images of a chunk must share the same "
+                             "shape to be stacked.") from err
+
+
 class LabelizeRegions:
     """ Label connected regions in a binary mask and extract contours.
 
@@ -372,23 +796,43 @@ class LabelizeRegions:
         self._labels = labels
         self._regions = measure.regionprops(labels)
 
-        if max_ratio is not None and max_ratio > 1.0:
-            self._remove_elongated(max_ratio)
+        remove = max_ratio is not None and max_ratio > 1.0
+
+        if remove or properties is not None:
+            table, helpers = self._properties_table(properties, remove)
+
+        if remove:
+            table = self._remove_elongated(table, max_ratio)
             labels = self._labels
 
         self._contours = measure.find_contours(labels, level=0.5)
 
         if properties is not None:
-            table = measure.regionprops_table(labels, properties=properties)
-            self._table = pd.DataFrame(table)
+            self._table = table.drop(columns=helpers)
+
+    def _properties_table(self, properties, remove):
+        """ Compute all required region properties in a single pass. """
+        required = list(properties) if properties is not None else []
+        helpers = ["label", "eccentricity"] if remove else ["label"]
+        helpers = [p for p in helpers if p not in required]
+
+        table = measure.regionprops_table(self._labels,
+                                          properties=required + helpers)
 
-    def _remove_elongated(self, max_ratio: float) -> None:
+        return pd.DataFrame(table), helpers
+
+    def _remove_elongated(self, table, max_ratio):
         """ Remove elongated objects based on their eccentricity. """
         eccentricity = np.sqrt(1 - (1/max_ratio)**2)
+        elongated = table["eccentricity"].to_numpy() > eccentricity
+
+        # Remap all labels at once through a lookup table; properties of
+        # the remaining regions are unchanged, so rows are just filtered.
+        lut = np.arange(self._labels.max() + 1, dtype=self._labels.dtype)
+        lut[table["label"].to_numpy()[elongated]] = 0
+        self._labels = lut[self._labels]
 
-        for region in self._regions:
-            if region.eccentricity > eccentricity:
-                self._labels[self._labels == region.label] = 0
+        return table.loc[~elongated].reset_index(drop=True)
 
     @property
     def table(self) -> pd.DataFrame:
@@ -433,6 +877,116 @@ class LabelizeRegions:
 
         return tmp
 
+    def boundaries(self, width: int = 2, mode: str = "inner") -> NDArray:
+        """ Rasterize region boundaries from the label image.
+
+        Parameters
+        ----------
+        width : int = 2
+            Width of the boundary lines in pixels.
+        mode : str = "inner"
+            Boundary mode as in `skimage.segmentation.find_boundaries`.
+
+        Returns
+        -------
+        NDArray
+            Boolean mask with the same shape as the label image.
+        """
+        edges = segmentation.find_boundaries(self._labels, mode=mode)
+
+        if width > 1:
+            footprint = morphology.footprint_rectangle((width, width))
+            edges = morphology.dilation(edges, footprint)
+
+        return edges
+
+    def overlay_boundaries(self,
+            image: NDArray | None = None,
+            *,
+            color: tuple[int, int, int] = (255, 0, 0),
+            width: int = 2,
+            mode: str = "inner"
+        ) -> Image.Image:
+        """ Overlay rasterized region boundaries on the input image.
+
+        Unlike `overlay_contours`, no vector contour is drawn: boundary
+        pixels are detected on the label array and composited in NumPy,
+        what scales with image size instead of the number of contours.
+
+        Parameters
+        ----------
+        image : ndarray | None, optional
+            Image on which to overlay the boundaries. If None, uses the
+            internal mask, by default None.
+        color : tuple, optional
+            Color of the boundary lines, by default (255, 0, 0).
+        width : int, optional
+            Width of the boundary lines, by default 2.
+        mode : str, optional
+            Boundary mode as in `skimage.segmentation.find_boundaries`,
+            by default "inner".
+
+        Returns
+        -------
+        Image.Image
+            RGB image with the boundaries drawn in the given color.
+        """
+        if image is None:
+            image = self._mask
+
+        rgb = skutil.img_as_ubyte(image)
+
+        if rgb.ndim == 2:
+            rgb = np.stack([rgb] * 3, axis=-1)
+        else:
+            rgb = rgb[..., :3].copy()
+
+        rgb[self.boundaries(width=width, mode=mode)] = color
+
+        return Image.fromarray(rgb)
+
+    @staticmethod
+    def export_overlays(
+            regions: dict[str, "LabelizeRegions"],
+            dirname: str | Path,
+            *,
+            images: dict[str, NDArray] | None = None,
+            workers: int | None = None,
+            **kwargs
+        ) -> list[Path]:
+        """ Export rasterized boundary overlays of many images.
+
+        Parameters
+        ----------
+        regions : dict[str, LabelizeRegions]
+            Labelled regions indexed by the output file stem.
+        dirname : str | Path
+            Directory where the PNG files are written.
+        images : dict[str, NDArray] | None = None
+            Background images indexed as `regions`; if not provided (or
+            missing for a given key), the internal mask is used.
+        workers : int | None = None
+            Number of threads used for rendering and writing.
+        kwargs
+            Keyword arguments forwarded to `overlay_boundaries`.
+
+        Returns
+        -------
+        list[Path]
+            Paths of the written files, in the order of `regions`.
+        """
+        (dirname := Path(dirname)).mkdir(parents=True, exist_ok=True)
+        images = images or {}
+
+        def export(name):
+            image = images.get(name)
+            overlay = regions[name].overlay_boundaries(image, **kwargs)
+            overlay.save(fname := dirname / f"{name}.png")
+            return fname
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(export, regions))
+
 
 class HelpersFFT:
     """ Helper methods for FFT-based analysis. """
@@ -603,6 +1157,400 @@ class HyperSpySEMImageLoaderStub(AbstractSEMImageLoader):
         return HelpersFFT.plot_spectrum2d(P, Nx, Ny, Lx, Ly, vstep=vstep)
 
 
+class TiledImage:
+    """ Tile-wise processing of large 2-D arrays with overlap handling.
+
+    Data is only read tile by tile, so that any array-like supporting
+    slicing (NumPy memory maps, Dask arrays from lazy HyperSpy signals,
+    or plain arrays) can be processed with bounded memory.
+
+    Parameters
+    ----------
+    data : Any
+        Two-dimensional array-like to be processed.
+    tile : int = 2048
+        Size (in pixels) of the square tiles.
+    overlap : int = 0
+        Halo (in pixels) added around tiles given to `map` functions,
+        so that neighborhood operations are exact at tile seams.
+    """
+    __slots__ = ("_data", "_tile", "_overlap")
+
+    def __init__(self, data: Any, tile: int = 2048, overlap: int = 0
+                 ) -> None:
+        if tile < 1 or overlap < 0:
+            raise ValueError(f"Invalid tiling (tile={tile}, "
+                             f"overlap={overlap})")
+
+        self._data = data
+        self._tile = tile
+        self._overlap = overlap
+
+    def _slices(self, overlap):
+        """ Tile (image, inner, halo) slices without reading the data. """
+        H, W = self.shape
+
+        for y0 in range(0, H, self._tile):
+            for x0 in range(0, W, self._tile):
+                y1 = min(y0 + self._tile, H)
+                x1 = min(x0 + self._tile, W)
+
+                hy0, hx0 = max(0, y0 - overlap), max(0, x0 - overlap)
+                hy1, hx1 = min(H, y1 + overlap), min(W, x1 + overlap)
+
+                outer = (slice(y0, y1), slice(x0, x1))
+                inner = (slice(y0 - hy0, y1 - hy0),
+                         slice(x0 - hx0, x1 - hx0))
+                halo = (slice(hy0, hy1), slice(hx0, hx1))
+
+                yield outer, inner, halo
+
+    def __iter__(self) -> Iterator[tuple[tuple[slice, slice],
+                                         tuple[slice, slice], NDArray]]:
+        """ Iterate over tiles as (image slices, inner slices, block).
+
+        Image slices locate the tile interior in the full image, inner
+        slices locate the same interior within the block, which also
+        includes the overlap halo (clipped at image borders).
+        """
+        for outer, inner, halo in self._slices(self._overlap):
+            yield outer, inner, np.asarray(self._data[halo])
+
+    def _interiors(self):
+        """ Iterate over tile interiors only (halo discarded). """
+        for outer, *_ in self._slices(0):
+            yield np.asarray(self._data[outer])
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """ Get the image shape as (height, width). """
+        return tuple(self._data.shape[:2])
+
+    def map(self,
+            func: Callable[[NDArray], NDArray],
+            out: NDArray | None = None,
+            dtype: Any = None
+        ) -> NDArray:
+        """ Apply a shape-preserving function tile by tile.
+
+        Parameters
+        ----------
+        func : Callable[[NDArray], NDArray]
+            Function applied to each block (tile plus halo).
+        out : NDArray | None = None
+            Output array (e.g. created with `np.lib.format.open_memmap`
+            for results larger than memory); allocated if not provided.
+        dtype : Any = None
+            Data type of the allocated output; if not provided, the type
+            returned by `func` for the first tile is used.
+
+        Returns
+        -------
+        NDArray
+            Array with the function results assembled.
+        """
+        for outer, inner, block in self:
+            result = np.asarray(func(block))
+
+            if out is None:
+                out = np.empty(self.shape + result.shape[2:],
+                               dtype=dtype or result.dtype)
+
+            out[outer] = result[inner]
+
+        return out
+
+    def label(self, out: NDArray | None = None) -> NDArray:
+        """ Label connected non-zero regions tile by tile.
+
+        Each tile is labelled independently (8-connectivity), then
+        labels touching across tile seams are merged through a graph
+        of connected components and remapped in a second tile pass.
+
+        Parameters
+        ----------
+        out : NDArray | None = None
+            Integer output array; allocated as int64 if not provided.
+
+        Returns
+        -------
+        NDArray
+            Consecutive labels of connected regions, zero as background.
+        """
+        if out is None:
+            out = np.zeros(self.shape, dtype=np.int64)
+
+        tiles = TiledImage(self._data, tile=self._tile)
+        offset = 0
+
+        for outer, _, block in tiles:
+            labels, n = measure.label(block > 0, return_num=True,
+                                      connectivity=2)
+            labels = labels.astype(out.dtype)
+            labels[labels > 0] += offset
+
+            out[outer] = labels
+            offset += n
+
+        H, W = self.shape
+        pairs = [np.empty((0, 2), dtype=out.dtype)]
+
+        for y in range(self._tile, H, self._tile):
+            pairs.append(self._seam_pairs(out[y - 1, :], out[y, :]))
+
+        for x in range(self._tile, W, self._tile):
+            pairs.append(self._seam_pairs(out[:, x - 1], out[:, x]))
+
+        edges = np.concatenate(pairs)
+        weights = np.ones(len(edges), dtype=np.int8)
+        shape = (offset + 1, offset + 1)
+
+        graph = coo_matrix((weights, (edges[:, 0], edges[:, 1])), shape)
+        _, components = connected_components(graph, directed=False)
+
+        # Node 0 (background) is the first visited, thus it keeps label
+        # zero after making the component indices consecutive:
+        _, lut = np.unique(components, return_inverse=True)
+        lut = lut.astype(out.dtype)
+
+        # Only labels are remapped, the data needs not be read again:
+        for outer, *_ in self._slices(0):
+            out[outer] = lut[np.asarray(out[outer])]
+
+        return out
+
+    def otsu_threshold(self, nbins: int = 256) -> float:
+        """ Otsu threshold of the whole image from tile histograms.
+
+        Histograms are accumulated over all tiles (in two passes, the
+        first one finding the data range) following the conventions of
+        `skimage.filters.threshold_otsu`, thus giving the same level as
+        computed over the whole image.
+
+        Parameters
+        ----------
+        nbins : int = 256
+            Number of histogram bins; ignored for integer images, for
+            which each integer value has its own bin.
+
+        Returns
+        -------
+        float
+            Threshold level; pixels above it belong to the foreground.
+        """
+        vmin, vmax = np.inf, -np.inf
+
+        for block in self._interiors():
+            vmin = min(vmin, block.min())
+            vmax = max(vmax, block.max())
+
+        if vmin == vmax:
+            return vmin
+
+        if np.issubdtype(self._data.dtype, np.integer):
+            vmin, vmax = int(vmin), int(vmax)
+            centers = np.arange(vmin, vmax + 1)
+            counts = np.zeros(centers.size, dtype=np.int64)
+
+            for block in self._interiors():
+                shifted = block.astype(np.int64).ravel() - vmin
+                counts += np.bincount(shifted, minlength=centers.size)
+        else:
+            edges = np.histogram_bin_edges([], bins=nbins,
+                                           range=(vmin, vmax))
+            centers = 0.5 * (edges[:-1] + edges[1:])
+            counts = np.zeros(nbins, dtype=np.int64)
+
+            for block in self._interiors():
+                counts += np.histogram(block, bins=nbins,
+                                       range=(vmin, vmax))[0]
+
+        return filters.threshold_otsu(hist=(counts, centers))
+
+    def threshold(self,
+            method: ThresholdImage,
+            out: NDArray | None = None,
+            **kw
+        ) -> NDArray:
+        """ Threshold the image tile by tile.
+
+        With OTSU, the global level is obtained with `otsu_threshold`
+        and matches the whole-image result (thresholding every tile
+        independently with `map` would use one level per tile). Other
+        methods are applied to tiles with their halo: MANUAL is exact,
+        SAUVOLA and NIBLACK (without `scale`) match the whole image up
+        to round-off if `overlap` is at least half the window size, but
+        LOCAL_OTSU blocks and `scale` reductions are aligned to tiles.
+
+        Parameters
+        ----------
+        method : ThresholdImage
+            Thresholding method.
+        out : NDArray | None = None
+            Output array; allocated as boolean if not provided.
+        **kw
+            Keyword arguments forwarded to `ThresholdImage.apply`.
+
+        Returns
+        -------
+        NDArray
+            Binary mask of the whole image.
+        """
+        if method is ThresholdImage.OTSU:
+            level = self.otsu_threshold()
+            return self.map(lambda block: block > level, out=out)
+
+        return self.map(lambda block: method.apply(block, **kw), out=out)
+
+    @staticmethod
+    def _seam_pairs(a, b):
+        """ Pairs of labels touching across a seam (8-connectivity). """
+        a, b = np.asarray(a), np.asarray(b)
+
+        pairs = np.concatenate([
+            np.stack([a, b], axis=1),
+            np.stack([a[:-1], b[1:]], axis=1),
+            np.stack([a[1:], b[:-1]], axis=1),
+        ])
+
+        return pairs[(pairs[:, 0] > 0) & (pairs[:, 1] > 0)]
+
+
+class LazySEMImageLoader(AbstractSEMImageLoader):
+    """ Lazy SEM image loader exposing zero-copy views of the data.
+
+    Contrary to `HyperSpySEMImageLoaderStub`, no copy of the image is
+    kept in memory: uncompressed TIFF files are memory-mapped and other
+    formats are opened as lazy HyperSpy signals (Dask arrays). Data is
+    then processed tile by tile through `tiles`.
+
+    Parameters
+    ----------
+    filepath : str | Path
+        Path to the image file.
+    pixel_size : float | None = None
+        Pixel size in micrometers; if not provided, it is retrieved from
+        the HyperSpy axes calibration (HS backend only).
+    backend : str = "TIFF"
+        Either "TIFF" for memory mapping or "HS" for lazy HyperSpy.
+    title : str = ""
+        Title used when viewing the image.
+    """
+    __slots__ = ("_image", "_pixel_size", "_title")
+
+    _UNITS = {"m": 1.0e+06, "mm": 1.0e+03, "µm": 1.0, "um": 1.0,
+              "nm": 1.0e-03, "pm": 1.0e-06}
+
+    def __init__(self,
+            filepath: str | Path,
+            pixel_size: float | None = None,
+            backend: str = "TIFF",
+            title: str = ""
+        ) -> None:
+        super().__init__()
+
+        match backend.upper():
+            case "TIFF":
+                self._image = self._memmap_tiff(filepath)
+            case "HS":
+                signal = hs_load(filepath, lazy=True)
+                self._image = signal.data
+
+                if pixel_size is None:
+                    pixel_size = self._calibration(signal)
+            case _:
+                raise ValueError(f"Unknown backend '{backend}', currently"
+                                 f" available: TIFF, HS")
+
+        if pixel_size is None:
+            raise ValueError("Pixel size must be provided for backend "
+                             f"'{backend}'.")
+
+        self._pixel_size = float(pixel_size)
+        self._title = title
+
+    @staticmethod
+    def _memmap_tiff(filepath):
+        try:
+            return tifffile.memmap(filepath, mode="r")
+        except ValueError as err:
+            raise ValueError(f"File {filepath} cannot be memory-mapped "
+                             f"(compressed or tiled TIFF?); use the HS "
+                             f"backend instead.") from err
+
+    @classmethod
+    def _calibration(cls, signal):
+        axis = signal.axes_manager.signal_axes[0]
+        units = str(axis.units).strip()
+
+        if units not in cls._UNITS:
+            raise ValueError(f"Unknown axis units '{units}', please "
+                             f"provide the pixel size explicitly.")
+
+        return axis.scale * cls._UNITS[units]
+
+    @classmethod
+    def from_array(cls, data: Any, pixel_size: float, title: str = ""
+                   ) -> Self:
+        """ Create a loader wrapping an existing array-like (no copy). """
+        obj = cls.__new__(cls)
+        obj._image = data
+        obj._pixel_size = float(pixel_size)
+        obj._title = title
+        return obj
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """ Get the image shape as (height, width). """
+        return tuple(self._image.shape[:2])
+
+    @property
+    def pixel_size(self) -> float:
+        """ Pixel size (in micrometers). """
+        return self._pixel_size
+
+    @property
+    def data(self) -> Any:
+        """ Get a zero-copy view of the image data. """
+        return self._image
+
+    @data.setter
+    def data(self, value: Any) -> None:
+        """ Set the image data from an array-like. """
+        self._image = value
+
+    def crop(self, crop: ImageCrop) -> Self:
+        """ Get a new loader over a zero-copy view of the cropped ROI. """
+        x0, y0, x1, y1 = crop.get_coords(self._image)
+        view = self._image[y0:y1, x0:x1]
+        return type(self).from_array(view, self._pixel_size, self._title)
+
+    def tiles(self, tile: int = 2048, overlap: int = 0) -> TiledImage:
+        """ Get a tile-wise processor over the image data. """
+        return TiledImage(self._image, tile=tile, overlap=overlap)
+
+    def view(self, **kwargs) -> Figure:
+        """ Plot a strided (decimated) preview of the image. """
+        max_size = kwargs.pop("max_size", 2048)
+        stride = max(1, int(np.ceil(max(self.shape) / max_size)))
+        preview = np.asarray(self._image[::stride, ::stride])
+
+        plt.close("all")
+
+        fig, ax = plt.subplots(
+            figsize=kwargs.pop("figsize", (8, 6)),
+            facecolor=kwargs.pop("facecolor", "white")
+        )
+        ax.imshow(preview, cmap="gray")
+        ax.set_title(kwargs.pop("title", self._title))
+        ax.axis("off")
+
+        if kwargs.pop("show", False):
+            plt.show()
+
+        return fig
+
+
 class CharacteristicLengthSEMImage:
     """" Compute the characteristic length of a 2D field through FFT. """
     __slots__ = ("_k_centers", "_spectrum", "_length", "_table")
@@ -655,13 +1603,13 @@ class CharacteristicLengthSEMImage:
         # Digitize all points at once
         idx = np.digitize(K.ravel(), k_bins)
 
-        # Vectorized radial average
-        E = np.zeros(nbins, dtype=P.dtype)
+        # Vectorized radial average (points at the last edge excluded):
+        counts = np.bincount(idx, minlength=nbins+2)[1:nbins+1]
+        sums = np.bincount(idx, weights=P.ravel(), minlength=nbins+2)
+        sums = sums[1:nbins+1]
 
-        for i in range(1, nbins+1):
-            mask = (idx == i)
-            if np.any(mask):
-                E[i-1] = P.ravel()[mask].mean()
+        E = np.zeros(nbins, dtype=P.dtype)
+        np.divide(sums, counts, out=E, where=counts > 0)
 
         return k, E
 
@@ -773,6 +1721,553 @@ class CharacteristicLengthSEMImage:
         return self._plot_spectrum_density(cutoff=cutoff)
 
 
+class CharacteristicLengthEngine:
+    """ Batched characteristic length analysis through real FFT.
+
+    Equivalent to `CharacteristicLengthSEMImage` radial spectra, but
+    using `rfft2` over the half-plane of wavenumbers (weighted to match
+    the full spectrum averages) and caching the Hann window and the
+    radial bin index maps per (shape, pixel size), as well as the
+    (radius, angle) bin maps per number of angles. The same engine can
+    be shared by many images, which are processed in a thread pool.
+
+    Parameters
+    ----------
+    nbins : int = 200
+        Number of radial wavenumber bins.
+    window : bool = True
+        Whether to apply a 2D (cosine) Hann window before the FFT.
+    """
+    __slots__ = ("_nbins", "_window", "_cache", "_lock")
+
+    def __init__(self, nbins: int = 200, window: bool = True) -> None:
+        self._nbins = nbins
+        self._window = window
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    def _geometry(self, shape, pixel_size):
+        """ Retrieve (or build) cached window and radial bin maps. """
+        key = (tuple(shape), float(pixel_size))
+
+        with self._lock:
+            if key not in self._cache:
+                self._cache[key] = self._build_geometry(*shape, pixel_size)
+
+            return self._cache[key]
+
+    def _build_geometry(self, Ny, Nx, pixel_size):
+        window = None
+
+        if self._window:
+            wx = 0.5 * (1 - np.cos(2 * np.pi * np.arange(Nx) / Nx))
+            wy = 0.5 * (1 - np.cos(2 * np.pi * np.arange(Ny) / Ny))
+            window = np.outer(wy, wx)
+
+        kx = np.abs(np.fft.rfftfreq(Nx, d=pixel_size))
+        ky = np.abs(np.fft.fftfreq(Ny, d=pixel_size))
+        K = np.hypot(kx[np.newaxis, :], ky[:, np.newaxis])
+
+        # Columns other than zero (and Nyquist, for even sizes) stand for
+        # their mirrored negative wavenumbers in the full spectrum:
+        mult = np.full(K.shape, 2.0)
+        mult[:, 0] = 1.0
+
+        if Nx % 2 == 0:
+            mult[:, -1] = 1.0
+
+        k_bins = np.linspace(0, K.max(), self._nbins + 1)
+        k_centers = 0.5 * (k_bins[:-1] + k_bins[1:])
+
+        # Same binning convention as `radial_binarization`, including the
+        # exclusion of points lying exactly at the last edge:
+        idx = np.digitize(K.ravel(), k_bins)
+        mult = mult.ravel()
+        counts = np.bincount(idx, weights=mult, minlength=self._nbins + 2)
+        counts = counts[1:self._nbins + 1]
+
+        return window, idx, mult, counts, k_centers
+
+    def _power(self, data, window):
+        """ Power spectrum over the half-plane of wavenumbers. """
+        f = data if window is None else data * window
+        return np.abs(np.fft.rfft2(f))**2
+
+    def _radial_mean(self, P, geometry):
+        """ Mean power per radial bin of a power spectrum. """
+        _, idx, mult, counts, k = geometry
+
+        sums = np.bincount(idx, weights=mult * P.ravel(),
+                           minlength=self._nbins + 2)
+        sums = sums[1:self._nbins + 1]
+
+        E = np.zeros(self._nbins, dtype=P.dtype)
+        np.divide(sums, counts, out=E, where=counts > 0)
+
+        return k, E
+
+    def spectrum(self, data: NDArray, pixel_size: float
+                 ) -> tuple[NDArray, NDArray]:
+        """ Compute the radially averaged power spectrum of an image.
+
+        Parameters
+        ----------
+        data : NDArray
+            Two-dimensional image data.
+        pixel_size : float
+            Pixel size in micrometers.
+
+        Returns
+        -------
+        tuple[NDArray, NDArray]
+            Wavenumber bin centers (1/µm) and mean power per bin.
+        """
+        geometry = self._geometry(data.shape, pixel_size)
+        return self._radial_mean(self._power(data, geometry[0]), geometry)
+
+    def _angular_geometry(self, shape, pixel_size, nangles):
+        """ Retrieve (or build) cached (radius, angle) bin maps. """
+        key = (tuple(shape), float(pixel_size), int(nangles))
+
+        with self._lock:
+            if key in self._cache:
+                return self._cache[key]
+
+        # Built outside of the lock, which is taken by `_geometry`:
+        geometry = self._build_angular_geometry(shape, pixel_size, nangles)
+
+        with self._lock:
+            return self._cache.setdefault(key, geometry)
+
+    def _build_angular_geometry(self, shape, pixel_size, nangles):
+        Ny, Nx = shape
+        kx = np.fft.rfftfreq(Nx, d=pixel_size)
+        ky = np.fft.fftfreq(Ny, d=pixel_size)
+
+        # Spectrum of real fields is centro-symmetric, thus the
+        # orientation of wavevectors is folded into [0, pi) and
+        # binned with bins centered at multiples of pi/nangles:
+        theta = np.arctan2(ky[:, np.newaxis], kx[np.newaxis, :])
+        theta = theta.ravel() * nangles / np.pi + 0.5
+
+        a_idx = np.mod(np.floor(theta), nangles).astype(np.intp)
+
+        window, idx, mult, _, k = self._geometry(shape, pixel_size)
+
+        # Radial bins out of range (index 0 or nbins+1) go to a dump bin:
+        r_idx = idx - 1
+        valid = (r_idx >= 0) & (r_idx < self._nbins)
+        n_total = self._nbins * nangles
+        ij = np.where(valid, r_idx * nangles + a_idx, n_total)
+
+        counts = np.bincount(ij, weights=mult, minlength=n_total + 1)
+        counts = counts[:n_total].reshape(self._nbins, nangles)
+
+        return window, ij, mult, counts, k
+
+    def _angular_mean(self, P, geometry, nangles):
+        """ Mean power per (radius, angle) bin of a power spectrum. """
+        _, ij, mult, counts, k = geometry
+
+        n_total = self._nbins * nangles
+        sums = np.bincount(ij, weights=mult * P.ravel(),
+                           minlength=n_total + 1)
+        sums = sums[:n_total].reshape(self._nbins, nangles)
+
+        E = np.zeros((self._nbins, nangles), dtype=P.dtype)
+        np.divide(sums, counts, out=E, where=counts > 0)
+
+        angles = np.arange(nangles) * 180.0 / nangles
+
+        return k, angles, E
+
+    def angular_spectrum(self,
+            data: NDArray,
+            pixel_size: float,
+            nangles: int = 12
+        ) -> tuple[NDArray, NDArray, NDArray]:
+        """ Compute the (radius, angle) binned power spectrum of an image.
+
+        Parameters
+        ----------
+        data : NDArray
+            Two-dimensional image data.
+        pixel_size : float
+            Pixel size in micrometers.
+        nangles : int = 12
+            Number of orientation bins over [0, 180) degrees, centered
+            at multiples of 180/nangles and measured from the image
+            horizontal axis.
+
+        Returns
+        -------
+        tuple[NDArray, NDArray, NDArray]
+            Wavenumber bin centers (1/µm), orientation bin centers (deg)
+            of the wavevectors, and mean power of shape (nbins, nangles).
+        """
+        geometry = self._angular_geometry(data.shape, pixel_size, nangles)
+        P = self._power(data, geometry[0])
+
+        return self._angular_mean(P, geometry, nangles)
+
+    def _orientation_table(self, P, geometry, nangles):
+        k, angles, E = self._angular_mean(P, geometry, nangles)
+        counts = geometry[3]
+
+        # Skip zero-frequency bin:
+        i_peak = np.argmax(E[1:], axis=0) + 1
+        power = (E * counts)[1:].sum(axis=0)
+
+        # A constant image has no power out of the zero-frequency bin:
+        fraction = np.zeros_like(power)
+        np.divide(power, power.sum(), out=fraction, where=power.sum() > 0)
+
+        return pd.DataFrame({
+            "Angle (deg)": angles,
+            "Characteristic length (µm)": 1.0 / k[i_peak],
+            "Power fraction": fraction,
+        })
+
+    def orientation_table(self,
+            data: NDArray,
+            pixel_size: float,
+            nangles: int = 12
+        ) -> pd.DataFrame:
+        """ Compute orientation-dependent characteristic lengths.
+
+        Parameters
+        ----------
+        data : NDArray
+            Two-dimensional image data.
+        pixel_size : float
+            Pixel size in micrometers.
+        nangles : int = 12
+            Number of orientation bins over [0, 180) degrees.
+
+        Returns
+        -------
+        pd.DataFrame
+            Characteristic length for each wavevector orientation.
+        """
+        geometry = self._angular_geometry(data.shape, pixel_size, nangles)
+        P = self._power(data, geometry[0])
+
+        return self._orientation_table(P, geometry, nangles)
+
+    @staticmethod
+    def anisotropy(table: pd.DataFrame) -> tuple[float, float]:
+        """ Compute anisotropy index and principal orientation.
+
+        Both are obtained from the second angular harmonic of the power
+        distribution (orientation tensor of the spectrum); the index is
+        zero for isotropic microstructures and approaches one when all
+        power is concentrated along a single wavevector orientation.
+
+        Parameters
+        ----------
+        table : pd.DataFrame
+            Table as produced by `orientation_table`.
+
+        Returns
+        -------
+        tuple[float, float]
+            Anisotropy index in [0, 1] and principal wavevector
+            orientation in degrees; both are zero if there is no power
+            out of the zero-frequency bin (constant image).
+        """
+        theta = np.deg2rad(table["Angle (deg)"].to_numpy())
+        weight = table["Power fraction"].to_numpy()
+
+        if not (total := np.sum(weight)) > 0:
+            return 0.0, 0.0
+
+        moment = np.sum(weight * np.exp(2j * theta)) / total
+        angle = np.mod(np.rad2deg(np.angle(moment)) / 2, 180.0)
+
+        return float(np.abs(moment)), float(angle)
+
+    @staticmethod
+    def _peak_length(k, E):
+        # Skip zero-frequency bin:
+        i_peak = np.argmax(E[1:]) + 1
+        return 1.0 / k[i_peak]
+
+    def characteristic_length(self, data: NDArray, pixel_size: float
+                              ) -> float:
+        """ Compute the characteristic length (µm) of an image. """
+        return self._peak_length(*self.spectrum(data, pixel_size))
+
+    def table(self,
+            images: dict[str, AbstractSEMImageLoader | tuple[NDArray, float]],
+            workers: int | None = None,
+            nangles: int | None = None
+        ) -> pd.DataFrame:
+        """ Compute characteristic lengths of many images.
+
+        Parameters
+        ----------
+        images : dict[str, AbstractSEMImageLoader | tuple[NDArray, float]]
+            Images indexed by name, either as loaders or as pairs of
+            image data and pixel size (in micrometers).
+        workers : int | None = None
+            Number of threads; FFT kernels release the GIL.
+        nangles : int | None = None
+            If provided, also compute the anisotropy index and the
+            principal wavevector orientation using this number of
+            orientation bins.
+
+        Returns
+        -------
+        pd.DataFrame
+            Table with image names, shapes, pixel sizes and lengths.
+        """
+        columns = ["Name", "Shape", "Pixel size (µm)",
+                   "Characteristic length (µm)"]
+
+        if nangles is not None:
+            columns += ["Anisotropy index", "Principal orientation (deg)"]
+
+        def compute(name):
+            entry = images[name]
+
+            if isinstance(entry, AbstractSEMImageLoader):
+                data, pixel_size = entry.data, entry.pixel_size
+            else:
+                data, pixel_size = entry
+
+            # A single FFT serves both the radial and angular binning:
+            geometry = self._geometry(data.shape, pixel_size)
+            P = self._power(data, geometry[0])
+
+            length = self._peak_length(*self._radial_mean(P, geometry))
+            row = [name, data.shape, pixel_size, length]
+
+            if nangles is not None:
+                geometry = self._angular_geometry(data.shape, pixel_size,
+                                                  nangles)
+                table = self._orientation_table(P, geometry, nangles)
+                row += list(self.anisotropy(table))
+
+            return row
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            rows = list(pool.map(compute, images))
+
+        return pd.DataFrame(rows, columns=columns)
+
+
+class ImageMetadataIndex:
+    """ Incremental metadata index of image archives.
+
+    Files are scanned with a pool of threads reading only file headers
+    (EXIF tags without thumbnails or maker notes, and SEM tags of TIFF
+    files from Zeiss and FEI instruments). Results are stored in a
+    Parquet file keyed by (path, size, mtime), so that subsequent scans
+    only parse new or modified files.
+
+    Parameters
+    ----------
+    index_file : str | Path
+        Path to the Parquet index file; created on first scan.
+    """
+    __slots__ = ("_index_file", "_table")
+
+    COLUMNS = ("path", "size", "mtime", "pixel_size", "magnification",
+               "timestamp", "latitude", "longitude", "altitude", "error")
+
+    _UNITS = LazySEMImageLoader._UNITS
+
+    _TIFF_SUFFIXES = (".tif", ".tiff")
+
+    def __init__(self, index_file: str | Path) -> None:
+        self._index_file = Path(index_file)
+
+        if self._index_file.exists():
+            self._table = pd.read_parquet(self._index_file)
+        else:
+            self._table = self._empty_table()
+
+    @classmethod
+    def _empty_table(cls):
+        table = pd.DataFrame({c: [] for c in cls.COLUMNS})
+        return cls._coerce(table)
+
+    @staticmethod
+    def _coerce(table):
+        return table.astype({
+            "path": str, "size": np.int64, "mtime": np.int64,
+            "pixel_size": float, "magnification": float,
+            "timestamp": "datetime64[ns]", "latitude": float,
+            "longitude": float, "altitude": float, "error": str,
+        })
+
+    @staticmethod
+    def _stat(fname):
+        st = Path(fname).stat()
+        return str(fname), st.st_size, st.st_mtime_ns
+
+    @staticmethod
+    def _gps_degrees(tags, key):
+        if (value := tags.get(f"GPS {key}")) is None:
+            return np.nan
+
+        d, m, sec = (float(v) for v in value.values)
+        degrees = d + m / 60 + sec / 3600
+
+        if str(tags.get(f"GPS {key}Ref", "N")).strip() in ("S", "W"):
+            degrees = -degrees
+
+        return degrees
+
+    @classmethod
+    def _read_exif(cls, fname, row):
+        with open(fname, "rb") as reader:
+            tags = exifread.process_file(reader, details=False,
+                                         extract_thumbnail=False)
+
+        for key in ("EXIF DateTimeOriginal", "Image DateTime"):
+            if key not in tags:
+                continue
+
+            # Cameras often write placeholders such as "0000:00:00 ...":
+            with contextlib.suppress(ValueError):
+                stamp = str(tags[key]).strip()
+                row["timestamp"] = datetime.strptime(stamp,
+                                                     "%Y:%m:%d %H:%M:%S")
+                break
+
+        row["latitude"] = cls._gps_degrees(tags, "GPSLatitude")
+        row["longitude"] = cls._gps_degrees(tags, "GPSLongitude")
+
+        if (altitude := tags.get("GPS GPSAltitude")) is not None:
+            row["altitude"] = float(altitude.values[0])
+
+    @classmethod
+    def _read_sem(cls, fname, row):
+        with tifffile.TiffFile(fname) as tif:
+            zeiss = tif.sem_metadata
+            fei = tif.fei_metadata
+
+        if zeiss:
+            if (entry := zeiss.get("ap_image_pixel_size")) is not None:
+                _, value, *unit = entry
+                scale = cls._UNITS.get(unit[0] if unit else "m", np.nan)
+                row["pixel_size"] = float(value) * scale
+
+            if (entry := zeiss.get("ap_mag")) is not None:
+                row["magnification"] = cls._parse_magnification(entry[1])
+
+        if fei:
+            if (width := fei.get("Scan", {}).get("PixelWidth")) is not None:
+                row["pixel_size"] = float(width) * cls._UNITS["m"]
+
+    @staticmethod
+    def _parse_magnification(value):
+        if isinstance(value, (int, float)):
+            return float(value)
+
+        # Zeiss writes, e.g., "1.00 K X" for a magnification of 1000:
+        if not (match := re.match(r"\s*([\d.]+)\s*(K)?", str(value))):
+            return np.nan
+
+        number, kilo = match.groups()
+        return float(number) * (1000 if kilo else 1)
+
+    @classmethod
+    def _read_file(cls, entry):
+        fname, size, mtime = entry
+        row = {c: np.nan for c in cls.COLUMNS}
+        row.update(path=fname, size=size, mtime=mtime, timestamp=pd.NaT,
+                   error="")
+
+        try:
+            cls._read_exif(fname, row)
+
+            if Path(fname).suffix.lower() in cls._TIFF_SUFFIXES:
+                cls._read_sem(fname, row)
+        except Exception as err:
+            row["error"] = f"{type(err).__name__}: {err}"
+
+        return row
+
+    def _save(self):
+        tmp = self._index_file.with_suffix(".tmp.parquet")
+        self._table.to_parquet(tmp, index=False)
+        tmp.replace(self._index_file)
+
+    def scan(self,
+            *roots: str | Path,
+            patterns: tuple[str, ...] = ("*.tif", "*.tiff", "*.jpg",
+                                         "*.jpeg"),
+            workers: int | None = None
+        ) -> pd.DataFrame:
+        """ Scan directories and update the index incrementally.
+
+        Files unchanged since the last scan (same size and modification
+        time) are not parsed again; entries of files under the scanned
+        roots that no longer exist are dropped from the index.
+
+        Parameters
+        ----------
+        roots : str | Path
+            Directories to be recursively scanned.
+        patterns : tuple[str, ...] = ("*.tif", "*.tiff", "*.jpg", "*.jpeg")
+            Glob patterns of files to be indexed (case sensitive).
+        workers : int | None = None
+            Number of threads used for stat and header parsing.
+
+        Returns
+        -------
+        pd.DataFrame
+            The updated index table.
+        """
+        roots = [Path(r).resolve() for r in roots]
+        files = sorted({f for r in roots for p in patterns
+                        for f in r.rglob(p) if f.is_file()})
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            stats = list(pool.map(self._stat, files))
+
+            known = self._table.set_index("path")[["size", "mtime"]]
+            known = dict(zip(known.index, map(tuple, known.to_numpy())))
+            pending = [e for e in stats if known.get(e[0]) != e[1:]]
+
+            rows = list(pool.map(self._read_file, pending))
+
+        scanned = {e[0] for e in stats}
+        updated = {e[0] for e in pending}
+
+        def under_roots(path):
+            return any(Path(path).is_relative_to(r) for r in roots)
+
+        keep = [path not in updated and
+                (path in scanned or not under_roots(path))
+                for path in self._table["path"]]
+
+        new = self._coerce(pd.DataFrame(rows, columns=self.COLUMNS))
+        tables = [t for t in (self._table.loc[keep], new) if len(t)]
+
+        if tables:
+            table = pd.concat(tables, ignore_index=True)
+        else:
+            table = self._empty_table()
+
+        self._table = table.sort_values("path", ignore_index=True)
+        self._save()
+
+        return self._table
+
+    @property
+    def table(self) -> pd.DataFrame:
+        """ Provides access to the index table. """
+        return self._table
+
+    @property
+    def index_file(self) -> Path:
+        """ Provides access to the index file path. """
+        return self._index_file
+
+
 def load_metadata(fname: Path, backend: str = "HS"):
     """ Wrap metadata loading for readability of constructor.
 
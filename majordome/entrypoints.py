@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 import sys
+from argparse import ArgumentParser
 from .utilities import ColorPrint
 
 
@@ -20,6 +21,38 @@ def containerize():
 
 
 def diffusion_solver():
+    if any(arg.startswith("--batch") for arg in sys.argv[1:]):
+        _diffusion_solver_batch(sys.argv[1:])
+        return
+
     from ._core import diffusion_solver as main
 
     main(sys.argv[1:])
+
+
+def _diffusion_solver_batch(argv):
+    from .engineering.diffusion import DiffusionBatchRunner
+
+    parser = ArgumentParser(prog="diffusion_solver",
+                            description="Run a manifest of cases.")
+    parser.add_argument("--batch", type=str, required=True,
+                        help="TOML/YAML manifest listing the cases.")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Number of cases run simultaneously.")
+    parser.add_argument("--output", type=str, default=None,
+                        help="Directory for case logs and summary "
+                             "(relative to the working directory).")
+    args = parser.parse_args(argv)
+
+    runner = DiffusionBatchRunner(args.batch, workers=args.workers,
+                                  output=args.output)
+    summary = runner.run()
+
+    columns = ["name", "status", "return_code", "runtime_s",
+               "progress_records"]
+    print(summary[columns].to_string(index=False))
+
+    if (summary["status"] != "ok").any():
+        ColorPrint.red("Some cases failed, check logs in "
+                       f"{runner.output_directory}")
+        sys.exit(1)
@@ -6,6 +6,7 @@ _LAZY_EXPORTS = {
     "ConstantTimeStepInterval": ".elmer",
     "TimeStepAccumulator": ".elmer",
     "ElmerConvergenceData": ".elmer",
+    "ElmerConvergenceMonitor": ".elmer",
     "ElmerTabularMetadata": ".elmer",
     "ElmerTabularData": ".elmer",
 
@@ -20,11 +21,14 @@ _LAZY_EXPORTS = {
     "FluentDpmFile": ".fluent",
     "convert_xy_to_dict": ".fluent",
     "load_dpm_table": ".fluent",
+    "load_xy_pathlines": ".fluent",
+    "write_interpolation_file": ".fluent",
 
     # openfoam:
     "FoamTabularData": ".openfoam",
     "FoamLagrangianTable": ".openfoam",
     "FoamPostProcessingLoader": ".openfoam",
+    "FoamReportCache": ".openfoam",
 
     # meshing:
     "GmshSessionWrapper": ".meshing",
@@ -1,10 +1,15 @@
 # -*- coding: utf-8 -*-
+from copy import deepcopy
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from time import monotonic, sleep
 from typing import Any, Callable, Iterator, Self
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from numpy.typing import NDArray
 
 from ..utilities import MajordomePlot
@@ -99,15 +104,32 @@ class ConstantTimeStepInterval:
 class TimeStepAccumulator:
     """ Helper for creating cumulative time steps in Elmer SIF files.
 
+    Blocks are stored in a structured NumPy array (grown geometrically)
+    and SIF entries are formatted in a vectorized fashion, so that
+    schedules with thousands of blocks remain cheap; see `compact` for
+    merging adjacent blocks sharing the same time step.
+
     Parameters
     ----------
     time_steps : ConstantTimeStepInterval
         Variable number of time step intervals to accumulate.
     """
-    __slots__ = ("_time_steps",)
+    __slots__ = ("_blocks", "_size")
+
+    _DTYPE = np.dtype([("duration", np.float64), ("time_step", np.float64),
+                       ("intervals", np.int64), ("save_every", np.int64)])
+
+    _HEADERS = ("! Step Duration", "Timestep Sizes",
+                "Timestep Intervals", "Output Intervals")
+
+    _FORMATS = ("%13g", "%13.6e", "%13d", "%13d")
 
     def __init__(self, *time_steps: ConstantTimeStepInterval) -> None:
-        self._time_steps = list(time_steps)
+        self._blocks = np.empty(max(16, len(time_steps)), self._DTYPE)
+        self._size = 0
+
+        for time_step in time_steps:
+            self.append(time_step)
 
     def __repr__(self) -> str:
         """ String representation for debugging. """
@@ -117,15 +139,24 @@ class TimeStepAccumulator:
         """ String representation formatted for Elmer SIF file. """
         text = f"! >> Total duration: {self.duration:.6g} << !\n"
 
-        for k, row in self.to_dataframe().iterrows():
-            text += " ".join(map(str, row)) + "\n"
+        for label, values in zip(self._labels(), self._formatted()):
+            text += " ".join([label, *values]) + "\n"
 
         return text
 
+    def __len__(self) -> int:
+        """ Number of time step blocks. """
+        return self._size
+
+    @property
+    def blocks(self) -> NDArray:
+        """ Structured array of blocks with fields as in `_DTYPE`. """
+        return self._blocks[:self._size]
+
     @property
     def duration(self) -> float:
         """ Duration of the accumulated time steps. """
-        return sum(ts.duration for ts in self._time_steps)
+        return float(self.blocks["duration"].sum())
 
     def add_block(self, *, duration: float | None = None,
                   end_time: float | None = None,
@@ -167,29 +198,70 @@ class TimeStepAccumulator:
         time_step : ConstantTimeStepInterval
             The time step interval to append to the accumulator.
         """
-        self._time_steps.append(time_step)
+        if self._size == len(self._blocks):
+            self._blocks = np.resize(self._blocks, 2 * len(self._blocks))
 
-    def to_dataframe(self) -> pd.DataFrame:
-        """ Convert the accumulated time steps into a table. """
-        headers = ["! Step Duration", "Timestep Sizes",
-                   "Timestep Intervals", "Output Intervals"]
+        self._blocks[self._size] = (time_step.duration, time_step.time_step,
+                                    time_step.intervals, time_step.save_every)
+        self._size += 1
 
-        data = [ts.into_formatted_data() for ts in self._time_steps]
-        df = pd.DataFrame(data, columns=headers)
+    def compact(self, rtol: float = 1.0e-12) -> Self:
+        """ Merge adjacent blocks with the same time step in place.
 
-        # Format to get aligned equal signs in SIF:
-        n = len(data)
-        columns = [f"{c}({n})" for c in headers]
-        fmt = f"{{:<{1 + max(map(len, columns))}}} ="
+        Blocks are merged only if they share the time step (to relative
+        tolerance `rtol`) and output interval, and if the number of steps
+        of the preceding block is a multiple of the output interval, so
+        that the sequence of saved times is unchanged.
 
-        # Transpose for printing in Elmer SIF:
-        df = df.T.reset_index()
-        df.columns = list(range(len(df.columns)))
+        Parameters
+        ----------
+        rtol : float, optional
+            Relative tolerance for comparing time steps.
 
-        # Labels for Elmer SIF:
-        df[0] = [fmt.format(c) for c in columns]
+        Returns
+        -------
+        Self
+            The accumulator itself, allowing chained calls.
+        """
+        if self._size < 2:
+            return self
+
+        b = self.blocks
+        same = (np.isclose(b["time_step"][1:], b["time_step"][:-1],
+                           rtol=rtol, atol=0.0)
+                & (b["save_every"][1:] == b["save_every"][:-1])
+                & (b["intervals"][:-1] % b["save_every"][:-1] == 0))
+
+        starts = np.flatnonzero(np.r_[True, ~same])
+        merged = np.empty(len(starts), self._DTYPE)
+
+        merged["duration"] = np.add.reduceat(b["duration"], starts)
+        merged["intervals"] = np.add.reduceat(b["intervals"], starts)
+        merged["save_every"] = b["save_every"][starts]
+        merged["time_step"] = merged["duration"] / merged["intervals"]
+
+        self._blocks = merged
+        self._size = len(merged)
+
+        return self
+
+    def _labels(self) -> list[str]:
+        """ Labels of SIF entries with aligned equal signs. """
+        columns = [f"{c}({self._size})" for c in self._HEADERS]
+        fmt = f"{{:<{1 + max(map(len, columns))}}} ="
+        return [fmt.format(c) for c in columns]
+
+    def _formatted(self) -> list[list[str]]:
+        """ Vectorized formatting of blocks for the SIF entries. """
+        blocks = self.blocks
+        return [np.char.mod(fmt, blocks[name]).tolist()
+                for name, fmt in zip(self._DTYPE.names, self._FORMATS)]
 
-        return df
+    def to_dataframe(self) -> pd.DataFrame:
+        """ Convert the accumulated time steps into a table. """
+        rows = [[label, *values] for label, values
+                in zip(self._labels(), self._formatted())]
+        return pd.DataFrame(rows)
 
 
 class ElmerConvergenceData:
@@ -305,6 +377,202 @@ class ElmerConvergenceData:
         return plot
 
 
+class ElmerConvergenceMonitor(ElmerConvergenceData):
+    """ Incremental reader of convergence data of a running simulation.
+
+    Only the bytes appended to the file since the last call to `poll`
+    are parsed; complete new rows are appended to preallocated arrays
+    per solver (grown geometrically when full), so the cost of a poll
+    does not depend on the size of the log. All methods of the parent
+    class, including plotting, remain available.
+
+    Parameters
+    ----------
+    file_path : str | Path
+        Path to the file containing convergence data, typically output
+        by Elmer's SaveLine solver; the file may not exist yet.
+    capacity : int, optional
+        Initial number of rows allocated per solver. Default is 1024.
+    """
+    __slots__ = ("_path", "_offset", "_capacity", "_names", "_integers",
+                 "_typed", "_arrays", "_sizes", "_callbacks")
+
+    def __init__(self, file_path: str | Path, capacity: int = 1024) -> None:
+        self._path = Path(file_path)
+        self._capacity = capacity
+        self._callbacks = []
+        self._reset()
+        self.poll()
+
+    def _reset(self) -> None:
+        """ Forget all data, as for a file never read before. """
+        self._offset = 0
+        self._names = []
+        self._integers = []
+        self._typed = False
+        self._solvers = []
+        self._arrays = {}
+        self._sizes = {}
+
+    def _read_tail(self) -> bytes:
+        """ Read complete lines appended since last call. """
+        if not self._path.is_file():
+            return b""
+
+        if (size := self._path.stat().st_size) < self._offset:
+            self._reset()
+
+        with open(self._path, "rb") as fp:
+            fp.seek(self._offset)
+            tail = fp.read(size - self._offset)
+
+        tail = tail[:tail.rfind(b"\n") + 1]
+        self._offset += len(tail)
+
+        return tail
+
+    def _parse_header(self, tail: bytes) -> bytes:
+        """ Get column names from the leading line. """
+        header, _, tail = tail.partition(b"\n")
+
+        if not (line := header.decode().strip()).startswith("!"):
+            raise ValueError("Expected header line starting with '!' "
+                            f"- malformed file - got: '{line}'")
+
+        self._names = line.split()[1:]
+
+        return tail
+
+    def _detect_integers(self, tail: bytes) -> None:
+        """ Get integer columns from the first data row, once available. """
+        if not (first := next((row.split() for row in tail.splitlines()
+                               if row.strip()), None)):
+            return
+
+        self._integers = [name for name, token in zip(self._names, first)
+                          if token.lstrip(b"+-").isdigit()]
+        self._typed = True
+
+    def _append(self, solver: int, rows: NDArray[np.float64]) -> None:
+        """ Append rows to solver storage, growing it if required. """
+        if solver not in self._arrays:
+            shape = (max(self._capacity, len(rows)), len(self._names))
+            self._arrays[solver] = np.empty(shape)
+            self._sizes[solver] = 0
+            self._solvers.append(solver)
+
+        data = self._arrays[solver]
+        n = self._sizes[solver]
+
+        if n + len(rows) > len(data):
+            grown = np.empty((max(2 * len(data), n + len(rows)),
+                              data.shape[1]))
+            grown[:n] = data[:n]
+            self._arrays[solver] = data = grown
+
+        data[n:n+len(rows)] = rows
+        self._sizes[solver] = n + len(rows)
+
+    def on_update(self, callback: Callable[[dict[int, NDArray]], Any]) -> None:
+        """ Register a function called with new rows after each poll.
+
+        Parameters
+        ----------
+        callback : Callable[[dict[int, NDArray]], Any]
+            Function receiving a dictionary mapping solver IDs to the
+            array of rows (columns as in `column_names`) read.
+        """
+        self._callbacks.append(callback)
+
+    def poll(self) -> dict[int, NDArray[np.float64]]:
+        """ Read new non-linear iterations appended to the file.
+
+        Returns
+        -------
+        dict[int, NDArray[np.float64]]
+            New rows read for each solver; empty if nothing new.
+        """
+        if not (tail := self._read_tail()):
+            return {}
+
+        if not self._names:
+            tail = self._parse_header(tail)
+
+        # The header is often polled alone at the start of a simulation:
+        if not self._typed:
+            self._detect_integers(tail)
+
+        values = np.fromstring(tail, dtype=float, sep=" ")
+
+        if values.size % len(self._names):
+            raise ValueError(f"Malformed data appended to {self._path}")
+
+        rows = values.reshape(-1, len(self._names))
+        solver = rows[:, self._names.index("solver")].astype(int)
+        new = {}
+
+        for sid in np.unique(solver).tolist():
+            new[sid] = rows[solver == sid]
+            self._append(sid, new[sid])
+
+        if new:
+            for callback in self._callbacks:
+                callback(new)
+
+        return new
+
+    def follow(self,
+            interval: float = 1.0,
+            timeout: float | None = None
+        ) -> Iterator[dict[int, NDArray[np.float64]]]:
+        """ Iterate over new iterations as they are written to the file.
+
+        Parameters
+        ----------
+        interval : float, optional
+            Time in seconds between polls of the file. Default is 1.0.
+        timeout : float | None, optional
+            Stop iterating after this time in seconds without new data;
+            if not provided, iterate indefinitely.
+        """
+        last = monotonic()
+
+        while True:
+            if new := self.poll():
+                last = monotonic()
+                yield new
+            elif timeout is not None and monotonic() - last > timeout:
+                return
+
+            sleep(interval)
+
+    @property
+    def column_names(self) -> list[str]:
+        """ Names of columns of the convergence data. """
+        return self._names
+
+    def get_solver_data(self, solver_id: int) -> pd.DataFrame:
+        """ Get convergence data for a specific solver.
+
+        Parameters
+        ----------
+        solver_id : int
+            The ID of the solver to filter by.
+
+        Returns
+        -------
+        pd.DataFrame
+            DataFrame containing convergence data for the specified solver.
+        """
+        if solver_id not in self._solvers:
+            raise ValueError(f"Solver ID {solver_id} not found in data. "
+                             f"Available solvers: {self._solvers}")
+
+        data = self._arrays[solver_id][:self._sizes[solver_id]]
+        df = pd.DataFrame(data, columns=self._names)
+        return df.astype(dict.fromkeys(self._integers, np.int64))
+
+
 class ElmerTabularMetadata:
     """ Class to hold metadata from Elmer SaveLine .names file.
 
@@ -320,7 +588,15 @@ class ElmerTabularMetadata:
         self._metadata = self._read_metadata()
 
     def _read_metadata(self) -> dict:
-        """ Read all metadata from the .names file. """
+        """ Read all metadata from the .names file (cached until changed). """
+        stat = Path(self._filepath).stat()
+        key = (str(Path(self._filepath).resolve()), stat.st_size,
+               stat.st_mtime_ns)
+        return deepcopy(_read_names_cached(*key))
+
+    @staticmethod
+    def _parse_metadata(filepath: str | Path) -> dict:
+        """ Parse all metadata from the .names file. """
         sep = ":"
         metadata = {}
         columns = {}
@@ -334,7 +610,7 @@ class ElmerTabularMetadata:
             "Variables in columns of matrix:",
         ]
 
-        with open(self._filepath) as f:
+        with open(filepath) as f:
             for line in f:
                 line = line.strip()
 
@@ -380,6 +656,14 @@ class ElmerTabularMetadata:
 class ElmerTabularData:
     """ Class to represent the data of a SaveLine results file.
 
+    Data is parsed with NumPy's C tokenizer, integer columns being
+    detected from the first row (and checked over all rows if one of
+    them later holds real values). Repeated metadata names are suffixed
+    as `name.1`, `name.2`, and so on. With `cache=True` the whole table
+    is stored in a Parquet sidecar file (`<fname>.parquet`) tagged with
+    the size and modification time of the data and metadata files, and
+    later loads read from it as long as both files are unchanged.
+
     Parameters
     ----------
     fname : str | Path
@@ -390,6 +674,11 @@ class ElmerTabularData:
         as the data file, with the same name but with a .names extension.
         If still not found, it will look for the metadata file one level
          above the data file directory.
+    columns : list[str] | None, optional
+        Names of columns (as in metadata) to be loaded; by default all
+        columns are loaded.
+    cache : bool, optional
+        If true, use (and create if required) the Parquet sidecar cache.
 
     Raises
     ------
@@ -400,7 +689,9 @@ class ElmerTabularData:
 
     def __init__(self,
                  fname: str | Path, *,
-                 fmeta: str | Path | None = None):
+                 fmeta: str | Path | None = None,
+                 columns: list[str] | None = None,
+                 cache: bool = False):
         # Internally we require it to be a Path:
         fname = Path(fname)
         fmeta = Path(fmeta) if fmeta is not None else None
@@ -429,8 +720,106 @@ class ElmerTabularData:
             raise ValueError("Metadata file is required.")
 
         self._meta = ElmerTabularMetadata(fmeta)
-        self._data = pd.read_csv(fname, sep=r"\s+", header=None)
-        self._data.columns = list(self._meta.columns.values())
+        names = self._unique_names(self._meta.columns.values())
+
+        if columns is not None:
+            if missing := set(columns) - set(names):
+                raise KeyError(f"Unknown columns: {sorted(missing)}")
+
+        if cache:
+            self._data = self._load_cached(fname, fmeta, names, columns)
+        else:
+            self._data = self._load_text(fname, names, columns)
+
+    @staticmethod
+    def _unique_names(names) -> list[str]:
+        """ Suffix repeated metadata names as `name.1`, `name.2`, ... """
+        unique = []
+        seen = {}
+
+        for name in names:
+            if name in seen:
+                seen[name] += 1
+                name = f"{name}.{seen[name]}"
+
+            seen.setdefault(name, 0)
+            unique.append(name)
+
+        return unique
+
+    @staticmethod
+    def _load_text(fname, names, columns=None) -> pd.DataFrame:
+        """ Parse (selected columns of) data file with NumPy. """
+        with open(fname) as fp:
+            first = fp.readline().split()
+
+        def dtype(token):
+            return np.int64 if token.lstrip("+-").isdigit() else np.float64
+
+        types = [dtype(token) for token in first] or [np.float64] * len(names)
+
+        if len(types) != len(names):
+            raise ValueError(f"Data file has {len(types)} columns but "
+                             f"metadata declares {len(names)}.")
+
+        usecols = range(len(names))
+
+        if columns is not None:
+            usecols = [names.index(c) for c in columns]
+
+        fields = [(f"f{k}", types[k]) for k in usecols]
+
+        try:
+            data = np.loadtxt(fname, dtype=fields, usecols=usecols, ndmin=1)
+        except ValueError:
+            # Some column only looked integer in the first row, thus read
+            # as floats and keep integers only where all values are so:
+            data = np.loadtxt(fname, usecols=usecols, ndmin=2)
+            table = {}
+
+            for j, k in enumerate(usecols):
+                values = data[:, j]
+
+                if types[k] is np.int64 and np.all(values == np.rint(values)):
+                    values = values.astype(np.int64)
+
+                table[names[k]] = values
+
+            return pd.DataFrame(table)
+
+        return pd.DataFrame({names[k]: data[f"f{k}"] for k in usecols})
+
+    @classmethod
+    def _load_cached(cls, fname, fmeta, names, columns=None
+                     ) -> pd.DataFrame:
+        """ Load data from Parquet sidecar, creating it if outdated. """
+        sidecar = fname.with_name(f"{fname.name}.parquet")
+        stamp = {}
+
+        # Column names come from metadata, thus it is part of the key:
+        for prefix, path in [("", fname), ("names_", fmeta)]:
+            stat = path.stat()
+
+            for field in ("size", "mtime_ns"):
+                key = f"majordome:{prefix}{field}".encode()
+                stamp[key] = str(getattr(stat, f"st_{field}")).encode()
+
+        if sidecar.exists():
+            metadata = pq.read_schema(sidecar).metadata or {}
+
+            if all(metadata.get(k) == v for k, v in stamp.items()):
+                return pd.read_parquet(sidecar, columns=columns)
+
+        data = cls._load_text(fname, names)
+        table = pa.Table.from_pandas(data, preserve_index=False)
+        table = table.replace_schema_metadata({**table.schema.metadata,
+                                               **stamp})
+
+        tmp = sidecar.with_name(f"{sidecar.name}.tmp")
+        pq.write_table(table, tmp)
+        tmp.replace(sidecar)
+
+        return data if columns is None else data[columns]
 
     @property
     def metadata(self) -> ElmerTabularMetadata:
@@ -441,3 +830,9 @@ class ElmerTabularData:
     def data(self) -> pd.DataFrame:
         """ Provides access to the data of the save line. """
         return self._data
+
+
+@lru_cache(maxsize=128)
+def _read_names_cached(path, size, mtime_ns) -> dict:
+    """ Metadata parsing memoized on file path, size and mtime. """
+    return ElmerTabularMetadata._parse_metadata(path)
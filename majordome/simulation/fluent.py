@@ -1,12 +1,15 @@
 # -*- coding: utf-8 -*-
 import mmap
 import re
+from concurrent.futures import ProcessPoolExecutor
 from io import StringIO, TextIOWrapper
+from multiprocessing.shared_memory import SharedMemory
 from pathlib import Path
 from typing import Any, Callable, Iterator, Self
 
 import numpy as np
 import pandas as pd
+import polars as pl
 import pyparsing as pp
 from numpy.typing import NDArray
 from pyparsing import OneOrMore, Word, Suppress
@@ -15,6 +18,10 @@ from pyparsing import OneOrMore, Word, Suppress
 class FluentFvParticlesParser:
     """ Provides parsing of exported Fluent FVPARTICLES files.
 
+    All tracks are stored in a single contiguous array of shape
+    `(n_rows, n_variables)`; rows of track `i` are given by the slice
+    `offsets[i]:offsets[i+1]`.
+
     Parameters
     ----------
     fname: str | Path
@@ -25,7 +32,7 @@ class FluentFvParticlesParser:
     max_tracks: int = 100_000
         Maximum number of tracks to be parsed from file.
     """
-    __slots__ = ("_names", "_tracks", "_size")
+    __slots__ = ("_names", "_values", "_offsets", "_size")
 
     def __init__(self, fname: str | Path, encoding: str = "utf-8",
                  max_tracks: int = 100_000) -> None:
@@ -41,18 +48,17 @@ class FluentFvParticlesParser:
             parser = iter(mm.readline, b"")
             self._parse_header(parser)
 
-            n_tracks = 0
-            self._tracks = []
-
-            while n_tracks < max_tracks:
-                try:
-                    current = self._parse_track(parser)
-                    self._tracks.append(current)
-                    n_tracks += 1
-                except StopIteration:
-                    break
+            # Whole body is converted in C in a single pass; only track
+            # boundaries are then located in Python (one step per track).
+            # Unlike `np.fromstring`, conversion fails on a bad token
+            # instead of silently dropping the remainder of the file.
+            try:
+                tokens = np.array(mm[mm.tell():].split(), dtype=float)
+            except ValueError as err:
+                raise ValueError(f"Malformed track data in {fp.name}: "
+                                 f"{err}") from err
 
-            self._size = n_tracks
+        self._parse_tracks(tokens, max_tracks)
 
     def _parse_header(self, parser: Iterator):
         """ Manage parsing of header information. """
@@ -72,24 +78,46 @@ class FluentFvParticlesParser:
         names = [variable_name(next(parser)) for _ in range(n_vars)]
         self._names = ["x", "y", "z", *names]
 
-    def _parse_track(self, parser: Iterator):
-        """ Manage parsing of a single track data. """
+    def _parse_tracks(self, tokens: NDArray[np.float64], max_tracks: int):
+        """ Locate tracks in flat token stream and gather their rows. """
         n_cols = len(self._names)
-        n_rows = int(next(parser).decode())
-        current = np.empty((n_rows, n_cols), float)
+        n_tokens = tokens.size
+
+        heads = []
+        counts = []
+        pos = 0
+
+        while pos < n_tokens and len(heads) < max_tracks:
+            n_rows = int(tokens[pos])
+
+            if pos + 1 + n_rows * n_cols > n_tokens:
+                raise ValueError(f"Track {len(heads)} declares {n_rows} "
+                                 f"rows but data ends before them.")
 
-        for i in range(n_rows):
-            data = map(float, next(parser).decode().split())
-            current[i, :] = list(data)
+            heads.append(pos)
+            counts.append(n_rows)
+            pos += 1 + n_rows * n_cols
 
-        return current
+        self._size = len(heads)
+        self._offsets = np.zeros(self._size + 1, dtype=np.int64)
+        np.cumsum(counts, out=self._offsets[1:])
+
+        keep = np.zeros(n_tokens, dtype=bool)
+        keep[:pos] = True
+        keep[heads] = False
+
+        self._values = tokens[keep].reshape(-1, n_cols)
+
+    def _track(self, i: int) -> NDArray[np.float64]:
+        """ View over the rows of a single track. """
+        return self._values[self._offsets[i]:self._offsets[i+1]]
 
     def __getitem__(self, i: int) -> pd.DataFrame:
         """ Retrieve track data as a data frame. """
         if i >= self._size:
             raise IndexError(f"Track index {i} out of range [0:{self._size})")
 
-        return pd.DataFrame(self._tracks[i], columns=self._names)
+        return pd.DataFrame(self._track(i), columns=self._names)
 
     @property
     def n_tracks(self) -> int:
@@ -103,32 +131,82 @@ class FluentFvParticlesParser:
 
     @property
     def data(self) -> list[NDArray[np.float64]]:
-        """ Provides access to list of tracks data. """
-        return self._tracks
+        """ Provides access to list of tracks data (views of `values`). """
+        return [self._track(i) for i in range(self._size)]
+
+    @property
+    def values(self) -> NDArray[np.float64]:
+        """ Provides access to contiguous data of all tracks. """
+        return self._values
+
+    @property
+    def offsets(self) -> NDArray[np.int64]:
+        """ Provides access to row offsets of tracks in `values`. """
+        return self._offsets
+
+
+def _parse_ip_block(fname, start, end, shm_name, shape, dtype, row):
+    """ Parse a single `.ip` variable block into shared memory. """
+    shm = SharedMemory(name=shm_name)
+
+    try:
+        data = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+        with open(fname, "rb") as fp:
+            with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                values = np.fromstring(mm[start:end], dtype=float, sep=" ")
+
+        if values.size != shape[1]:
+            raise ValueError(f"Expected {shape[1]} values in block {row}, "
+                             f"got {values.size}")
+
+        data[row] = values
+        del data
+    finally:
+        shm.close()
 
 
 class FluentInterpolationParser:
     """ Provides parsing of exported Fluent interpolation files.
 
+    Byte offsets of all variable blocks are located in a single scan of
+    the memory-mapped file; blocks are then converted in bulk, either
+    sequentially or concurrently in a process pool writing to a shared
+    array when `workers` is provided.
+
     Parameters
     ----------
     fname: str | Path
         Path to `.ip` file to be parsed; file must be stored in plain
         text format, by default in UTF-8 encoding.
     float_type: type = float
-        Floatting point type; using built-in is faster, but you may also
-        use some NumPy type at your convenience (much slower).
+        Floatting point type of the data array.
     encoding: str = "utf-8"
         Encoding type for reading the file.
+    workers: int | None = None
+        Number of processes used for parsing blocks; if not provided,
+        blocks are parsed sequentially in the current process.
+    verbose: bool = True
+        If true, print the range of lines of each parsed variable.
     """
     def __init__(self, fname: str | Path, float_type: type = float,
-                 encoding: str = "utf-8"):
+                 encoding: str = "utf-8", workers: int | None = None,
+                 verbose: bool = True):
         if not Path(fname).exists():
             raise FileNotFoundError(f"Fluent IP file not found {fname}")
 
+        self._verbose = verbose
+
         with open(fname, "r", encoding=encoding) as fp:
             self._parse_manager(float_type, fp)
 
+        if workers is None:
+            self._parse_data(float_type, fname)
+        else:
+            self._parse_data_parallel(float_type, fname, workers)
+
+        self._data = self._data.T
+
     def _parse_manager(self, float_type, fp):
         """ Handle memory mapping with read-only access for parsing. """
         with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
@@ -146,31 +224,84 @@ class FluentInterpolationParser:
                 self._names.append(next(parser).decode()\
                                    .strip("\r").strip("\n").strip("\r\n"))
 
-            shape = (self._n_columns, self._n_points)
+            self._blocks = self._scan_blocks(mm, mm.tell())
 
-            self._data = np.empty(shape, float_type)
-            self._parse_data(float_type, parser)
+    def _scan_blocks(self, mm, pos):
+        """ Locate byte range of each variable block `(...)` in file. """
+        blocks = []
 
-        self._data = self._data.T
+        for var_idx in range(self._n_columns):
+            start = mm.find(b"(", pos)
+            end = mm.find(b")", start)
+
+            if start < 0 or end < 0:
+                raise ValueError(f"Missing data block for variable "
+                                 f"`{self._names[var_idx]}`")
+
+            blocks.append((start + 1, end))
+            pos = end + 1
+
+        return blocks
+
+    def _report_block(self, var_idx):
+        """ Display the range of lines of a variable block. """
+        if not self._verbose:
+            return
 
-    def _parse_data(self, float_type, parser):
-        """ Manage parsing of all variables from raw text. """
         vars_finish = self._n_variables + 5
+        name = self._names[var_idx]
+        s_idx = vars_finish + var_idx * (self._n_points + 1)
+        e_idx = s_idx + self._n_points
+        print(f"{name:>15s} in range ({s_idx:>10}:{e_idx:>10})")
 
-        for var_idx in range(self._n_columns):
-            name = self._names[var_idx]
-            s_idx = vars_finish + var_idx * (self._n_points + 1)
-            e_idx = s_idx + self._n_points
-            print(f"{name:>15s} in range ({s_idx:>10}:{e_idx:>10})")
+    def _parse_data(self, float_type, fname):
+        """ Manage parsing of all variables from raw text. """
+        shape = (self._n_columns, self._n_points)
+        self._data = np.empty(shape, float_type)
 
-            self._parse_variable(float_type, parser, self._data[var_idx])
+        with open(fname, "rb") as fp:
+            with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for var_idx, (start, end) in enumerate(self._blocks):
+                    self._report_block(var_idx)
+                    self._parse_variable(mm[start:end], var_idx)
 
-    def _parse_variable(self, float_type, parser, data):
+    def _parse_variable(self, block, var_idx):
         """ Manage parsing of a single variable into an array segment. """
-        for pnt_idx in range(self._n_points):
-            data[pnt_idx] = float_type(next(parser).decode().strip("("))
+        values = np.fromstring(block, dtype=float, sep=" ")
 
-        _ = next(parser)
+        if values.size != self._n_points:
+            raise ValueError(f"Expected {self._n_points} values for "
+                             f"`{self._names[var_idx]}`, got {values.size}")
+
+        self._data[var_idx] = values
+
+    def _parse_data_parallel(self, float_type, fname, workers):
+        """ Manage parsing of all variables in a process pool. """
+        shape = (self._n_columns, self._n_points)
+        dtype = np.dtype(float_type)
+
+        shm = SharedMemory(create=True, size=max(1, dtype.itemsize *
+                                                 shape[0] * shape[1]))
+
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = []
+
+                for var_idx, (start, end) in enumerate(self._blocks):
+                    self._report_block(var_idx)
+                    futures.append(pool.submit(
+                        _parse_ip_block, str(fname), start, end,
+                        shm.name, shape, dtype, var_idx))
+
+                for future in futures:
+                    future.result()
+
+            data = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+            self._data = data.copy()
+            del data
+        finally:
+            shm.close()
+            shm.unlink()
 
     @property
     def n_dimensions(self) -> int:
@@ -204,6 +335,84 @@ class FluentInterpolationParser:
         return self._data[:, self._names.index(name)]
 
 
+def write_interpolation_file(
+        fname: str | Path,
+        coordinates: NDArray[np.float64],
+        variables: dict[str, NDArray[np.float64]],
+        *,
+        version: int = 3,
+        precision: int | None = None,
+        chunk_size: int = 1_000_000,
+        overwrite: bool = False
+    ) -> None:
+    """ Write fields to a Fluent interpolation file.
+
+    Values are formatted in bulk by chunks of `chunk_size` points and
+    streamed to a buffered file, so that files with tens of millions of
+    points are written in a few seconds. Output can be read back with
+    `FluentInterpolationParser`.
+
+    Parameters
+    ----------
+    fname: str | Path
+        Path to the `.ip` file to be written.
+    coordinates: NDArray[np.float64]
+        Array of shape `(n_points, n_dimensions)` with point coordinates.
+    variables: dict[str, NDArray[np.float64]]
+        Mapping of Fluent variable names to arrays of `n_points` values.
+    version: int = 3
+        Interpolation file format version written in the first line.
+    precision: int | None = None
+        Number of decimals in scientific notation; if not provided, the
+        shortest representation that round-trips exactly is used.
+    chunk_size: int = 1_000_000
+        Number of values formatted at once.
+    overwrite: bool = False
+        If true, overwrite any existing file.
+
+    Raises
+    ------
+    FileExistsError
+        If the file already exists and `overwrite` is false.
+    """
+    if Path(fname).exists() and not overwrite:
+        raise FileExistsError(f"File {fname} exists, use `overwrite=True`.")
+
+    coordinates = np.asarray(coordinates, dtype=np.float64)
+
+    if coordinates.ndim == 1:
+        coordinates = coordinates[:, np.newaxis]
+
+    n_points, n_dimensions = coordinates.shape
+    columns = [*coordinates.T]
+
+    for name, values in variables.items():
+        if (values := np.ravel(values)).size != n_points:
+            raise ValueError(f"Variable `{name}` has {values.size} values, "
+                             f"expected {n_points}")
+
+        columns.append(values)
+
+    options = {"include_header": False}
+
+    if precision is not None:
+        options.update(float_scientific=True, float_precision=precision)
+
+    header = [version, n_dimensions, n_points, len(variables), *variables]
+
+    with open(fname, "wb", buffering=16 * 1024**2) as fp:
+        fp.write("".join(f"{h}\n" for h in header).encode())
+
+        for column in columns:
+            fp.write(b"(")
+
+            for k in range(0, n_points, chunk_size):
+                chunk = pl.DataFrame({"v": column[k:k+chunk_size]})
+                chunk.write_csv(fp, **options)
+
+            fp.write(b")\n")
+
+
 class FluentInputRow:
     """ Fluent TSV file data entry for automated parameter generation.
 
@@ -371,16 +580,26 @@ class FluentSchemeTableRow:
 
 
 class FluentDpmFile:
-    """ Parse a sampled Scheme DPM file generated by Fluent. """
+    """ Parse a sampled Scheme DPM file generated by Fluent.
+
+    Only the patch and header rows are parsed with the Scheme grammar;
+    the numeric body is stripped from parentheses and loaded in bulk by
+    a C-level reader, with row lengths validated on the resulting table.
+    """
+    _STRIP_PARENTHESES = str.maketrans("()", "  ")
+
     def __init__(self, fname: str) -> None:
         self._patch = None
         self._header = None
         self._ncols = None
-        self._data = []
+        self._named = False
 
         with open(fname) as fp:
-            for k, row in enumerate(fp.readlines()):
-                self._parse_row(k, row)
+            self._get_patch(fp.readline())
+            self._get_header(fp.readline())
+            body = fp.read()
+
+        self._data = self._parse_body(body)
 
     def _get_patch(self, row: str) -> None:
         self._patch = FluentSchemePatch(row)
@@ -390,24 +609,30 @@ class FluentDpmFile:
 
         if self._header[-1] == "name":
             self._header.pop()
+            self._named = True
 
         self._ncols = len(self._header)
 
-    def _parse_row(self, k: int, row: str) -> None:
-        match k:
-            case 0:
-                self._get_patch(row)
-                return
-            case 1:
-                self._get_header(row)
-                return
+    def _parse_body(self, body: str) -> NDArray[np.float64]:
+        if not body.strip():
+            return np.empty((0, self._ncols))
+
+        body = StringIO(body.translate(self._STRIP_PARENTHESES))
+        names = range(self._ncols + self._named)
+        dtype = dict.fromkeys(range(self._ncols), np.float64)
 
-        data = FluentSchemeTableRow(row)
+        try:
+            df = pd.read_csv(body, sep=r"\s+", header=None, names=names,
+                             dtype=dtype, engine="c")
+        except (pd.errors.ParserError, ValueError) as err:
+            raise ValueError(f"Malformed file: {err}") from err
 
-        if len(data.values) != self._ncols:
-            raise ValueError(f"Malformed file at row {k+1}")
+        data = df.iloc[:, :self._ncols].to_numpy()
 
-        self._data.append(data.values)
+        if (bad := np.flatnonzero(df.isna().any(axis=1))).size:
+            raise ValueError(f"Malformed file at row {bad[0]+3}")
+
+        return data
 
     def to_dataframe(self):
         """ Convert parsed data to a data frame for analysis. """
@@ -478,6 +703,63 @@ def convert_xy_to_dict(
     return all_blocks
 
 
+_XY_PARTICLE_BLOCK = re.compile(
+    rb"\(\(xy/key/label\s+\"particle-(\d+)\"\)([^)]*)\)")
+
+
+def load_xy_pathlines(
+        fname: str | Path
+    ) -> tuple[NDArray[np.int64], NDArray[np.int64], NDArray[np.float64]]:
+    """ Load all pathlines of an Ansys XY file in a single pass.
+
+    Streaming alternative to `convert_xy_to_dict`: particle blocks are
+    located with a compiled regular expression over the memory-mapped
+    file and their values gathered into a single array.
+
+    Parameters
+    ----------
+    fname: str | Path
+        Path to ".xy" file to be loaded by function.
+
+    Returns
+    -------
+    tuple[NDArray[np.int64], NDArray[np.int64], NDArray[np.float64]]
+        Particle numbers, offsets and coordinates; the `(n, 2)` array of
+        X and Y coordinates of particle `particles[i]` is given by rows
+        `offsets[i]:offsets[i+1]` of the coordinates array.
+    """
+    particles = []
+    blocks = []
+
+    with open(fname, "rb") as fp:
+        with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for match in _XY_PARTICLE_BLOCK.finditer(mm):
+                particle = int(match.group(1))
+
+                # `np.fromstring` would stop silently at a bad token:
+                try:
+                    values = np.array(match.group(2).split(), dtype=float)
+                except ValueError as err:
+                    raise ValueError(f"Malformed value for particle "
+                                     f"{particle}: {err}") from err
+
+                if values.size % 2:
+                    raise ValueError(f"Odd number of values for particle "
+                                     f"{particle}")
+
+                particles.append(particle)
+                blocks.append(values)
+
+    counts = [block.size // 2 for block in blocks]
+    offsets = np.zeros(len(blocks) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+
+    coords = np.concatenate(blocks) if blocks else np.empty(0)
+    coords = coords.reshape(-1, 2)
+
+    return np.array(particles, dtype=np.int64), offsets, coords
+
+
 def load_dpm_table(fname: str) -> pd.DataFrame:
     """ Wrapper for simple loading of data table. """
     return FluentDpmFile(fname).to_dataframe()
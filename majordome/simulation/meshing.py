@@ -1,11 +1,17 @@
 # -*- coding: utf-8 -*-
 
 import functools
+import hashlib
 import itertools
+import json
+import os
+import re
 import shutil
+import tempfile
 
 from abc import ABC, abstractmethod
 from pathlib import Path
+from time import perf_counter
 from typing import Any, Callable, Self
 
 import gmsh
@@ -17,6 +23,60 @@ AnyNumber = int | float | np.number
 TrupleAny = tuple[AnyNumber, AnyNumber, AnyNumber]
 PlaneEquationAny = tuple[AnyNumber, AnyNumber, AnyNumber, AnyNumber]
 
+# Phase timings of Gmsh log, e.g. "Done meshing 2D (Wall 0.12s, CPU 0.1s)":
+_GMSH_PHASE_TIME = re.compile(
+    r"Done (meshing \dD|meshing order \d|optimizing mesh)"
+    r"\s*\(Wall ([\d.eE+-]+)s")
+
+
+def _jsonable(obj: Any) -> Any:
+    """ Serializable form of build parameters for hashing. """
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+
+    if isinstance(obj, np.generic):
+        return obj.item()
+
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj, key=repr)
+
+    if isinstance(obj, Path):
+        return obj.as_posix()
+
+    # Representations of arbitrary objects may embed memory addresses,
+    # which would make content addresses change on every run:
+    raise TypeError(f"Build parameter of type {type(obj).__name__} "
+                    f"cannot be used in a cache key; provide JSON types, "
+                    f"NumPy arrays or paths as cache `parameters`.")
+
+
+def _cached_artifacts(entry: Path) -> list[str] | None:
+    """ List of files of a complete cache entry, if any. """
+    if not (manifest := entry / "manifest.json").is_file():
+        return None
+
+    with open(manifest) as fp:
+        files = json.load(fp)["files"]
+
+    if not all((entry / name).is_file() for name in files):
+        return None
+
+    return files
+
+
+def _split_stl_solids(text: str) -> list[tuple[str, str]]:
+    """ Split ASCII STL text into (name, text) of its solids. """
+    solids = []
+
+    for block in re.split(r"(?m)^(?=solid\b)", text):
+        if not block.strip():
+            continue
+
+        name = block.split("\n", 1)[0][len("solid"):].strip()
+        solids.append((name, block))
+
+    return solids
+
 
 class GmshSessionWrapper(ABC):
     """ Helper mixin to provide a Gmsh session manager. """
@@ -73,13 +133,77 @@ class GmshSessionWrapper(ABC):
         """ Add face groups to the GMSH model. """
         self._face_groups = groups
 
+    def build_key(self, parameters: dict[str, Any]) -> str:
+        """ Content address of the geometry for the given parameters.
+
+        Parameters
+        ----------
+        parameters: dict[str, Any]
+            All (and only) the geometry and mesh parameters used by
+            `build`, as JSON types, NumPy arrays or paths.
+        """
+        cls = type(self)
+        content = json.dumps({
+            "class": f"{cls.__module__}.{cls.__qualname__}",
+            "parameters": parameters,
+        }, sort_keys=True, default=_jsonable)
+
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def _write_face_groups(self, stl_path: Path) -> list[str]:
+        """ Write all face groups from a single STL export. """
+        self._mod.remove_physical_groups()
+
+        tags = {}
+
+        for name, faces in self._face_groups.items():
+            tags[name] = self._mod.add_physical_group(
+                dim  =  2,
+                tags = faces,
+                name = name
+            )
+
+        options = {"Mesh.StlOneSolidPerSurface": 2, "Mesh.Binary": 0}
+        backup = {k: self._opt.getNumber(k) for k in options}
+        joint = stl_path / ".face-groups.stl"
+
+        try:
+            for key, value in options.items():
+                self._opt.setNumber(key, value)
+
+            gmsh.write(joint.as_posix())
+        finally:
+            for key, value in backup.items():
+                self._opt.setNumber(key, value)
+
+            self._mod.remove_physical_groups()
+
+        # Solids are named after physical groups, written in tag order:
+        ordered = sorted(tags, key=tags.get)
+        solids = _split_stl_solids(joint.read_text())
+        joint.unlink()
+
+        files = []
+
+        for k, (solid, lines) in enumerate(solids):
+            name = solid if solid in tags else ordered[k]
+            (stl_path / f"{name}.stl").write_text(lines)
+            files.append(f"{name}.stl")
+
+        return files
+
     def save_as_stl(
             self,
             dirname: str | Path = "stl",
-            fresh: bool = True
+            fresh: bool = True,
+            cache: str | Path | None = None,
+            parameters: dict[str, Any] | None = None
         ) -> None:
         """ Save face groups into individual stl files for meshing.
 
+        All face groups are exported at once, each as a solid named after
+        the group, and then split into individual files.
+
         Parameters
         ----------
         dirname: str | Path = "stl"
@@ -88,7 +212,19 @@ class GmshSessionWrapper(ABC):
         fresh: bool = True
             If True, clears any existing directory with that name
             before writing.
+        cache: str | Path | None = None
+            Directory of a content-addressed cache of artifacts, keyed
+            by `build_key`; if the geometry for the given `parameters`
+            was already saved there, `build` is skipped and the cached
+            files are copied instead.
+        parameters: dict[str, Any] | None = None
+            Geometry and mesh parameters identifying the artifacts in
+            the cache, required if `cache` is provided.
         """
+        if cache is not None and parameters is None:
+            raise ValueError("Build `parameters` are required to use the "
+                             "artifacts cache.")
+
         if isinstance(dirname, str):
             stl_path = Path.cwd() / dirname
         elif isinstance(dirname, Path):
@@ -103,26 +239,51 @@ class GmshSessionWrapper(ABC):
 
         stl_path.mkdir(parents=True, exist_ok=True)
 
+        if cache is not None:
+            entry = Path(cache).resolve() / self.build_key(parameters)
+
+            if (files := _cached_artifacts(entry)) is not None:
+                for name in files:
+                    shutil.copy2(entry / name, stl_path / name)
+
+                return
+
         # Build the geometry - to be implemented by subclasses:
         self.build()
 
-        # Remove any existing physical groups before proceeding:
-        self._mod.remove_physical_groups()
-
         if not self._face_groups:
             raise RuntimeError(
                 "No face groups defined. Use `self.add_face_groups`"
                 " to define face groups before saving as stl files."
             )
 
-        for name, tags in self._face_groups.items():
-            self._mod.add_physical_group(
-                dim  =  2,
-                tags = tags,
-                name = name
-            )
-            gmsh.write((stl_path / f"{name}.stl").as_posix())
-            self._mod.remove_physical_groups()
+        files = self._write_face_groups(stl_path)
+
+        if cache is None:
+            return
+
+        # Entry is assembled in a private directory and published with
+        # a single rename, so concurrent builds never see partial files:
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        tmp = Path(tempfile.mkdtemp(prefix=f".{entry.name}.",
+                                    dir=entry.parent))
+
+        try:
+            for name in files:
+                shutil.copy2(stl_path / name, tmp / name)
+
+            with open(tmp / "manifest.json", "w") as fp:
+                json.dump({"class": type(self).__qualname__, "files": files,
+                           "parameters": parameters},
+                          fp, indent=2, default=_jsonable)
+
+            tmp.rename(entry)
+        except OSError:
+            # Another build published the same entry first, keep it:
+            if _cached_artifacts(entry) is None:
+                raise
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
 
     @staticmethod
     def occ_sync(f):
@@ -398,49 +559,112 @@ class GmshOCCModel:
 
         return objs
 
-    def rotate_all_nodes(self,
-            axis: str | TrupleAny,
-            angle: float,
+    def transform_all_nodes(self,
+            matrix: NDArray[np.float64],
+            translation: TrupleAny = (0, 0, 0),
             snap_axis: str | None = None,
-            axis_tolerance: float = 1.0e-06
+            axis_tolerance: float = 1.0e-06,
+            dimtags: list[tuple[int, int]] | None = None
         ) -> None:
-        """ Produces a rotation matrix over the given axis.
+        """ Apply an affine transformation to mesh nodes in bulk.
+
+        Transformation `x' = M @ x + t` is applied by Gmsh to all nodes
+        in a single call, so any linear map (rotation, dilation, mirror)
+        is handled at once; see `rotation_matrix` for building rotations,
+        `np.diag(factors)` for dilations or `I - 2 n n^T` for a mirror
+        about a plane of unit normal `n`. If snapping is requested, only
+        the transformed nodes falling within tolerance of the axis are
+        then updated.
 
         Parameters
         ----------
-        axis: str | TrupleAny
-            Rotation axis (a direction tuple or any of 'x', 'y', 'z').
-        angle: float
-            The overall rotation angle in degrees.
+        matrix: NDArray[np.float64]
+            Linear part `M` of the transformation, shape `(3, 3)`.
+        translation: TrupleAny = (0, 0, 0)
+            Translation vector `t` applied after the linear map.
         snap_axis: str | None = None
-            Enforce snap values to axis.
+            Enforce snap values of transformed nodes to axis.
         axis_tolerance: float = 1.0e-06
             Tolerance for snapping to axis.
+        dimtags: list[tuple[int, int]] | None = None
+            Entities whose nodes are transformed; all nodes if None.
         """
-        node_tags, coords, _ = self._model.mesh.getNodes()
-        nodes = coords.reshape(-1, 3)
+        matrix = np.asarray(matrix, dtype=float)
+        translation = np.asarray(translation, dtype=float)
 
-        R = rotation_matrix(axis, angle)
-        rotated_nodes = nodes @ R.T
+        if matrix.shape != (3, 3) or translation.shape != (3,):
+            raise ValueError("Expected a (3, 3) matrix and a 3-vector.")
+
+        components = None
 
         if snap_axis is not None:
-            # Snap nodes near the to exact zero.
-            # TODO generalize to any axis to match its line.
             match snap_axis.strip().lower():
                 case "x":
-                    nodes[np.abs(nodes[:, 1]) < axis_tolerance, 1] = 0.0
-                    nodes[np.abs(nodes[:, 2]) < axis_tolerance, 2] = 0.0
+                    components = [1, 2]
                 case "y":
-                    nodes[np.abs(nodes[:, 0]) < axis_tolerance, 0] = 0.0
-                    nodes[np.abs(nodes[:, 2]) < axis_tolerance, 2] = 0.0
+                    components = [0, 2]
                 case "z":
-                    nodes[np.abs(nodes[:, 0]) < axis_tolerance, 0] = 0.0
-                    nodes[np.abs(nodes[:, 1]) < axis_tolerance, 1] = 0.0
-                case "_":
-                    raise ValueError(f"Unknonw axis {snap_axis}")
+                    components = [0, 1]
+                case _:
+                    raise ValueError(f"Unknown axis {snap_axis}")
+
+        if components is not None:
+            # Nodes are read before the transform, as Gmsh may not
+            # update its cache of coordinates right away.
+            node_tags, coords, _ = self._mesh.getNodes(
+                returnParametricCoord=False)
+            nodes = coords.reshape(-1, 3) @ matrix.T + translation
+
+        affine = np.hstack([matrix, translation[:, np.newaxis]])
+        self._mesh.affineTransform(affine.ravel().tolist(), dimtags or [])
+
+        if components is None:
+            return
 
-        for tag, coord in zip(node_tags, rotated_nodes):
-            self._model.mesh.setNode(int(tag), coord.tolist(), [])
+        if dimtags:
+            # Restrict snapping to nodes classified on the entities, the
+            # only ones moved by `affineTransform` (not the boundary):
+            tags = np.concatenate([
+                self._mesh.getNodes(dim, tag, includeBoundary=False,
+                                    returnParametricCoord=False)[0]
+                for dim, tag in dimtags
+            ])
+            keep = np.isin(node_tags, tags)
+            node_tags, nodes = node_tags[keep], nodes[keep]
+
+        near = np.abs(nodes[:, components]) < axis_tolerance
+        snap = near.any(axis=1)
+
+        # Snap transformed nodes near the axis to exact zero.
+        # TODO generalize to any axis to match its line.
+        sub = nodes[snap]
+        sub[:, components] = np.where(near[snap], 0.0, sub[:, components])
+
+        for tag, coord in zip(node_tags[snap].tolist(), sub.tolist()):
+            self._mesh.setNode(tag, coord, [])
+
+    def rotate_all_nodes(self,
+            axis: str | TrupleAny,
+            angle: float,
+            snap_axis: str | None = None,
+            axis_tolerance: float = 1.0e-06
+        ) -> None:
+        """ Rotate all mesh nodes over the given axis.
+
+        Parameters
+        ----------
+        axis: str | TrupleAny
+            Rotation axis (a direction tuple or any of 'x', 'y', 'z').
+        angle: float
+            The overall rotation angle in degrees.
+        snap_axis: str | None = None
+            Enforce snap values of rotated nodes to axis.
+        axis_tolerance: float = 1.0e-06
+            Tolerance for snapping to axis.
+        """
+        self.transform_all_nodes(rotation_matrix(axis, angle),
+                                 snap_axis=snap_axis,
+                                 axis_tolerance=axis_tolerance)
 
     def recombine_surface(self, tag: int, **kws) -> None:
         """ Apply recombine constraint to 2D entities.
@@ -503,11 +727,118 @@ class GmshOCCModel:
 
         self.synchronize()
 
-    def mesh_and_save(self, filename: str, *, dim: int, **kws) -> None:
-        """ Generate mesh and save to file. """
+    def configure_threads(self,
+            threads: int | None = None,
+            *,
+            hxt: bool = False
+        ) -> None:
+        """ Enable multithreaded meshing.
+
+        Gmsh meshes curves and surfaces in parallel (for algorithms that
+        support it) with up to `Mesh.MaxNumThreads1D/2D` threads, while
+        volumes are parallelized by the 3-D algorithm itself, of which
+        HXT (`Mesh.Algorithm3D = 10`) is the most scalable one.
+
+        Parameters
+        ----------
+        threads: int | None = None
+            Number of threads; if not provided, the number of CPUs.
+        hxt: bool = False
+            If true, select the parallel HXT volume meshing algorithm.
+        """
+        threads = threads or os.cpu_count() or 1
+
+        self.configure({
+            "General.NumThreads": threads,
+            "Mesh.MaxNumThreads1D": threads,
+            "Mesh.MaxNumThreads2D": threads,
+            "Mesh.MaxNumThreads3D": threads,
+            "Mesh.Algorithm3D": 10 if hxt else None,
+        })
+
+    def count_elements(self) -> dict[str, int]:
+        """ Number of nodes and elements of each dimension in mesh. """
+        counts = {"nodes": len(self._mesh.getNodes(
+            returnParametricCoord=False)[0])}
+
+        for dim in range(4):
+            _, tags, _ = self._mesh.getElements(dim)
+            counts[f"elements_{dim}d"] = sum(map(len, tags))
+
+        return counts
+
+    def mesh_and_save(self,
+            filename: str,
+            *,
+            dim: int,
+            optimize: str | None = None,
+            **kws
+        ) -> dict[str, Any]:
+        """ Generate mesh and save to file.
+
+        Parameters
+        ----------
+        filename: str
+            Path of the mesh file to be written.
+        dim: int
+            Dimension of the mesh to be generated.
+        optimize: str | None = None
+            Method passed to `gmsh.model.mesh.optimize` (for instance,
+            "Netgen" or "HighOrder") after generation, if provided.
+
+        Returns
+        -------
+        dict[str, Any]
+            Performance report with the number of threads, wall times
+            in seconds of meshing phases as reported by Gmsh (`1D`, `2D`,
+            `3D`, `order N` and cumulated `optimization`) and measured
+            around calls (`generate`, `optimize` and `write`), and the
+            number of nodes and elements of each dimension.
+        """
         self.synchronize()
-        self.generate_mesh(dim)
+
+        # A logger started by the caller is left running and only the
+        # lines added by this call are parsed.
+        before = gmsh.logger.get()
+
+        if owner := not before:
+            # Starting an active (yet empty) logger only logs a warning:
+            gmsh.logger.start()
+            before = gmsh.logger.get()
+            owner = not before
+
+        try:
+            t0 = perf_counter()
+            self.generate_mesh(dim)
+            t1 = perf_counter()
+
+            if optimize is not None:
+                self._mesh.optimize(optimize)
+
+            t2 = perf_counter()
+            log = gmsh.logger.get()[len(before):]
+        finally:
+            if owner:
+                gmsh.logger.stop()
+
         gmsh.write(filename)
+        t3 = perf_counter()
+
+        timings = {}
+
+        for match in map(_GMSH_PHASE_TIME.search, log):
+            if match is not None:
+                phase = match[1].replace("meshing ", "")
+                phase = phase.replace("optimizing mesh", "optimization")
+                timings[phase] = timings.get(phase, 0.0) + float(match[2])
+
+        timings.update(generate=t1 - t0, optimize=t2 - t1, write=t3 - t2)
+
+        return {
+            "threads": int(gmsh.option.getNumber("General.NumThreads")),
+            "timings": timings,
+            **self.count_elements(),
+        }
 
     def dump(self, *args):
         """ Dump the mesh to files with given names. """
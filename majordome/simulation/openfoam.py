@@ -1,37 +1,166 @@
 # -*- coding: utf-8 -*-
 
+import json
 import re
 
 from abc import ABC, abstractmethod
-from io import StringIO
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 from pathlib import Path
+from typing import Self
 
 import pandas as pd
 import polars as pl
+import pyarrow as pa
+
+from ..utilities import majordome_warning
+
+# Byte-level normalization of Lagrangian clouds to single-space fields:
+_VECTOR_DELIMITERS = bytes.maketrans(b"()\t\r", b"    ")
+_REPEATED_SPACES = re.compile(rb" {2,}")
+_LINE_EDGE_SPACES = re.compile(rb"(?m)^ | $")
+_BLANK_LINES = re.compile(rb"(?m)^\n")
+
+# Schema of long-format tables returned by `load_case(tidy=True)`:
+_TIDY_SCHEMA = {"region": pl.String, "report": pl.String, "time": pl.Float64,
+                "variable": pl.String, "value": pl.Float64}
 
 
 class AbstractFoamDataLoader(ABC):
     """ Abstract interface for loading multiple postProcessing files.
 
+    Files are loaded concurrently and merged into a single Polars frame.
+    Optionally, where restarts overlap in time, rows of a file later than
+    the start time of the next restart are discarded, so that the most
+    recent run prevails; this is only supported by loaders whose first
+    column holds the time (`_TIME_INDEXED` set by the class).
+
     Parameters
     ----------
     files : list[Path]
         List of files to load.
+    workers : int | None = None
+        Number of threads used for loading files; by default, as many
+        as chosen by `ThreadPoolExecutor`.
+    deduplicate : bool = False
+        If true, discard overlapping times between restarts.
     kwargs
         Additional keyword arguments to pass to the loader function.
     """
 
     __slots__ = ("_df",)
 
-    def __init__(self, files: list[Path], **kwargs) -> None:
-        data_frames = [self.loader(file, **kwargs) for file in files]
-        self._df = pd.concat(data_frames, ignore_index=True)
-        self._df.columns = self.get_header(files[0])
+    _TIME_INDEXED = False
+
+    def __init__(self,
+            files: list[Path],
+            workers: int | None = None,
+            deduplicate: bool = False,
+            **kwargs
+        ) -> None:
+        header = self.get_header(files[0])
+
+        def load(file):
+            return self._as_polars(self.loader(file, **kwargs), header)
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            frames = list(pool.map(load, files))
+
+        self._merge(frames, header, deduplicate)
+
+    def _merge(self, frames, header, deduplicate):
+        """ Concatenate per-file frames into the loader data. """
+        frames = [df for df in frames if df.width]
+
+        if deduplicate and not self._TIME_INDEXED:
+            raise ValueError(f"Cannot deduplicate restarts with "
+                             f"{type(self).__name__}, whose data is not "
+                             f"indexed by time.")
+
+        if deduplicate:
+            frames = self._drop_overlaps(frames)
+
+        if not frames:
+            self._df = pl.DataFrame(schema=header)
+            return
+
+        self._df = pl.concat(frames, how="vertical_relaxed", rechunk=True)
+
+    @classmethod
+    def load_file(cls, fname: Path, **kwargs) -> pl.DataFrame:
+        """ Load a single file as a Polars frame named after its header.
+
+        Parameters
+        ----------
+        fname : Path
+            The path to the file.
+        kwargs
+            Additional keyword arguments to pass to the loader function.
+        """
+        self = cls.__new__(cls)
+        header = self.get_header(fname)
+        return self._as_polars(self.loader(fname, **kwargs), header)
+
+    @classmethod
+    def from_frames(cls,
+            frames: list[pl.DataFrame],
+            deduplicate: bool = False
+        ) -> Self:
+        """ Create loader from frames loaded with `load_file`.
+
+        Parameters
+        ----------
+        frames : list[pl.DataFrame]
+            Data of the individual files of a report.
+        deduplicate : bool = False
+            If true, discard overlapping times between restarts.
+        """
+        self = cls.__new__(cls)
+        header = next((df.columns for df in frames if df.width), [])
+        self._merge(frames, header, deduplicate)
+        return self
+
+    @staticmethod
+    def _as_polars(df, header):
+        """ Ensure loaded data is a Polars frame named after header. """
+        if isinstance(df, pd.DataFrame):
+            df = pl.from_pandas(df.set_axis(map(str, df.columns), axis=1))
+
+        if df.width:
+            df.columns = header
+
+        return df
+
+    @staticmethod
+    def _drop_overlaps(frames):
+        """ Order frames by start time and truncate overlapping ones. """
+        # Restarts producing only a header have no start time:
+        frames = [df for df in frames if df.height]
+        frames = sorted(frames, key=lambda df: df[:, 0].min())
+        merged = []
+
+        for df, after in zip(frames, frames[1:] + [None]):
+            if after is not None:
+                df = df.filter(pl.col(df.columns[0]) < after[:, 0].min())
+
+            merged.append(df)
+
+        return merged
 
     @property
     def table(self) -> pd.DataFrame:
         """ Provides access to a copy of loaded data. """
-        return self._df.copy()
+        return self._df.to_pandas()
+
+    @property
+    def frame(self) -> pl.DataFrame:
+        """ Provides access to loaded data as an immutable Polars frame. """
+        return self._df
+
+    @property
+    def arrow(self) -> pa.Table:
+        """ Provides a zero-copy Arrow view of loaded data. """
+        return self._df.to_arrow()
 
     @abstractmethod
     def get_header(self, fname: str | Path) -> list[str]:
@@ -50,7 +179,7 @@ class AbstractFoamDataLoader(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def loader(self, fname: Path, **kwargs) -> pd.DataFrame:
+    def loader(self, fname: Path, **kwargs) -> pl.DataFrame | pd.DataFrame:
         """ Loads body of data file.
 
         Parameters
@@ -62,8 +191,8 @@ class AbstractFoamDataLoader(ABC):
 
         Returns
         -------
-        pd.DataFrame
-            The parsed data as a pandas DataFrame.
+        pl.DataFrame | pd.DataFrame
+            The parsed data as a Polars or pandas DataFrame.
         """
         raise NotImplementedError
 
@@ -73,6 +202,8 @@ class FoamTabularData(AbstractFoamDataLoader):
 
     __slots__ = ()
 
+    _TIME_INDEXED = True
+
     def get_header(self, fname: str | Path) -> list[str]:
         """ Get the header line for a specific report.
 
@@ -86,25 +217,11 @@ class FoamTabularData(AbstractFoamDataLoader):
         list[str]
             The list of header column names.
         """
-        last_line = None
-
-        # Read until a line is not a comment:
-        with open(fname) as f:
-            for line in f:
-                if not line.startswith("#"):
-                    break
-
-                last_line = line
-
-        if last_line is None:
-            raise ValueError(f"No header found in report '{fname}'.")
+        return _get_tabular_header(fname)
 
-        last_line = last_line.lstrip("#").replace("\t", ",")
-        last_line = re.sub(r"\s+", " ", last_line).strip()
-        return [h.strip() for h in last_line.split(",")]
+    def loader(self, fname: Path, **kwargs) -> pl.DataFrame | pd.DataFrame:
+        """ Load OpenFOAM xy files into a DataFrame.
 
-    def loader(self, fname: Path, **kwargs) -> pd.DataFrame:
-        """ Load OpenFOAM xy files into a pandas DataFrame.
         Parameters
         ----------
         fname : Path
@@ -115,21 +232,47 @@ class FoamTabularData(AbstractFoamDataLoader):
 
         Returns
         -------
-        pd.DataFrame
-            The parsed data as a pandas DataFrame.
+        pl.DataFrame | pd.DataFrame
+            The parsed data as a DataFrame of the selected backend.
         """
         backend = kwargs.pop("backend", "polars")
         return _handle_loader_backend(fname, backend, **kwargs)
 
 
 class FoamLagrangianTable(AbstractFoamDataLoader):
-    """ Class to represent Lagrangian data from OpenFOAM reports. """
+    """ Class to represent Lagrangian data from OpenFOAM reports.
+
+    Files are streamed once in chunks of `chunk_size` bytes (keyword
+    argument of the loader, 64 MiB by default) from which parentheses
+    of vector fields are removed at byte level before the CSV engine,
+    so that memory used for raw text stays bounded for large clouds.
+    """
 
     __slots__ = ()
 
+    @staticmethod
+    def _clean(chunk: bytes) -> bytes:
+        """ Remove vector parentheses keeping fields space separated.
+
+        Parentheses, tabs and repeated spaces are collapsed into single
+        spaces, lines are stripped and blank lines dropped, so that fields
+        are separated by exactly one space as required by the CSV engines.
+        """
+        chunk = chunk.translate(_VECTOR_DELIMITERS)
+        chunk = _REPEATED_SPACES.sub(b" ", chunk)
+        chunk = _LINE_EDGE_SPACES.sub(b"", chunk)
+        return _BLANK_LINES.sub(b"", chunk)
+
+    @staticmethod
+    def _is_data(line: bytes) -> bool:
+        """ Check whether a line contains data (not empty or comment). """
+        return bool(line.strip()) and not line.lstrip().startswith(b"#")
+
     def get_header(self, fname: str | Path) -> list[str]:
         """ Get the header line for a specific report.
 
+        Only lines up to the first data row are read from file.
+
         Parameters
         ----------
         fname : str | Path
@@ -140,30 +283,20 @@ class FoamLagrangianTable(AbstractFoamDataLoader):
         list[str]
             The list of header column names.
         """
-        with open(fname, "r", encoding="utf-8") as f:
-            lines = f.readlines()
+        with open(fname, "rb") as f:
+            if not (header_line := f.readline()):
+                return []
 
-        if not lines:
-            return []
+            first_row = next(filter(self._is_data, f), b"")
 
-        header_line = lines[0].strip()
+        header_line = header_line.decode("utf-8").strip()
 
         if header_line.startswith("#"):
             header_line = header_line[1:].strip()
 
         header_clean = header_line.replace("(", " ").replace(")", " ")
         header_cols = header_clean.split()
-        num_cols = 0
-
-        for line in lines[1:]:
-            l_strip = line.strip()
-
-            if not l_strip or l_strip.startswith("#"):
-                continue
-
-            cleaned = l_strip.replace("(", " ").replace(")", " ")
-            num_cols = len(cleaned.split())
-            break
+        num_cols = len(self._clean(first_row).split())
 
         if num_cols == 0:
             return header_cols
@@ -183,8 +316,8 @@ class FoamLagrangianTable(AbstractFoamDataLoader):
 
         return header_cols
 
-    def loader(self, fname: Path, **kwargs) -> pd.DataFrame:
-        """ Load OpenFOAM Lagrangian files into a pandas DataFrame.
+    def loader(self, fname: Path, **kwargs) -> pl.DataFrame | pd.DataFrame:
+        """ Load OpenFOAM Lagrangian files into a DataFrame.
 
         Parameters
         ----------
@@ -192,36 +325,218 @@ class FoamLagrangianTable(AbstractFoamDataLoader):
             The path to the file.
         kwargs
             Additional keyword arguments to pass to the loader function.
+            The `backend` can be `polars` (default) or `pandas`, and the
+            `chunk_size` in bytes of streamed text can be provided.
 
         Returns
         -------
-        pd.DataFrame
-            The parsed data as a pandas DataFrame.
+        pl.DataFrame | pd.DataFrame
+            The parsed data as a DataFrame of the selected backend.
         """
         backend = kwargs.pop("backend", "polars")
+        chunk_size = kwargs.pop("chunk_size", 64 * 1024**2)
 
-        with open(fname, "r", encoding="utf-8") as f:
-            lines = f.readlines()
+        frames = []
+        tail = b""
 
-        if not lines:
-            return pd.DataFrame()
+        with open(fname, "rb") as f:
+            f.readline()
 
-        data_rows = []
+            while chunk := f.read(chunk_size):
+                # Keep incomplete last line for the next chunk:
+                chunk = tail + chunk
+                cut = chunk.rfind(b"\n") + 1
+                chunk, tail = chunk[:cut], chunk[cut:]
 
-        for line in lines[1:]:
-            l_strip = line.strip()
+                frames.append(self._load_chunk(chunk, backend, **kwargs))
 
-            if not l_strip or l_strip.startswith("#"):
-                continue
+        frames.append(self._load_chunk(tail, backend, **kwargs))
+        frames = [df for df in frames if df is not None]
+
+        if backend.lower() == "pandas":
+            if not frames:
+                return pd.DataFrame()
+
+            return pd.concat(frames, ignore_index=True)
+
+        if not frames:
+            return pl.DataFrame()
+
+        return pl.concat(frames, how="vertical_relaxed")
+
+    def _load_chunk(self, chunk, backend, **kwargs):
+        """ Parse a chunk of complete lines, if it contains any data. """
+        if not any(map(self._is_data, chunk.splitlines())):
+            return None
+
+        source = BytesIO(self._clean(chunk))
+        return _handle_loader_backend(source, backend, sep=" ", **kwargs)
+
+
+class FoamReportCache:
+    """ Incremental Parquet cache of appendable OpenFOAM reports.
+
+    For each file of the report the size and byte offset of the last
+    complete line parsed are kept in `index.json`; upon `refresh` only
+    the appended tail of each file is parsed and stored as a new Parquet
+    part, so that following a running case remains cheap whatever the
+    size of its reports. Files that shrunk are parsed again from start.
+
+    Parameters
+    ----------
+    report_dir : str | Path
+        Directory containing the (possibly multiple restart) files of a
+        tabular report, as handled by `FoamTabularData`.
+    cache_dir : str | Path
+        Directory where cached parts and index are stored.
+    max_parts : int = 64
+        Number of parts of a single file above which they are compacted
+        into a single Parquet file.
+    """
+
+    __slots__ = ("_report_dir", "_cache_dir", "_max_parts", "_index")
+
+    def __init__(self,
+            report_dir: str | Path,
+            cache_dir: str | Path,
+            max_parts: int = 64
+        ) -> None:
+        self._report_dir = Path(report_dir)
+        self._cache_dir = Path(cache_dir)
+        self._max_parts = max_parts
+        self._index = {"files": {}, "next_id": 0}
+
+        if (index_file := self._cache_dir / "index.json").exists():
+            with open(index_file) as fp:
+                self._index = json.load(fp)
+
+    def _write_index(self):
+        """ Atomically dump cache index to disk. """
+        tmp = self._cache_dir / "index.json.tmp"
+
+        with open(tmp, "w") as fp:
+            json.dump(self._index, fp, indent=2)
+
+        tmp.replace(self._cache_dir / "index.json")
+
+    def _parts(self, entry):
+        """ Sorted list of Parquet parts of a file entry. """
+        return sorted(self._cache_dir.glob(f"file-{entry['id']:04d}-*.pq"))
+
+    def _write_part(self, entry, df):
+        """ Store a new part of a file and compact parts if required. """
+        parts = self._parts(entry)
+
+        if len(parts) >= self._max_parts:
+            df = pl.concat([*map(pl.read_parquet, parts), df],
+                           how="vertical_relaxed")
+
+        k = entry["parts"]
+        tmp = self._cache_dir / f"file-{entry['id']:04d}-{k:06d}.tmp"
+        df.write_parquet(tmp)
+        tmp.replace(tmp.with_suffix(".pq"))
+        entry["parts"] += 1
+
+        if len(parts) >= self._max_parts:
+            for part in parts:
+                part.unlink()
+
+    def _new_entry(self):
+        """ Create an empty index entry with a unique identifier. """
+        entry = {"id": self._index["next_id"], "size": 0,
+                 "offset": 0, "parts": 0}
+
+        self._index["next_id"] += 1
+        return entry
+
+    def _update_file(self, fname, key, **kwargs):
+        """ Parse the unread tail of a file into a new part. """
+        entry = self._index["files"].get(key)
+        size = fname.stat().st_size
+
+        if entry is not None and size < entry["offset"]:
+            for part in self._parts(entry):
+                part.unlink()
+
+            entry = None
+
+        if entry is None:
+            entry = self._new_entry()
+            self._index["files"][key] = entry
+
+        if size > entry["offset"]:
+            with open(fname, "rb") as fp:
+                fp.seek(entry["offset"])
+                tail = fp.read(size - entry["offset"])
+
+            # Only complete lines are consumed, the rest is read later:
+            tail = tail[:tail.rfind(b"\n") + 1]
+
+            if (df := self._parse_tail(fname, tail, **kwargs)) is not None:
+                self._write_part(entry, df)
+
+            entry["offset"] += len(tail)
+
+        entry["size"] = size
+
+    @staticmethod
+    def _parse_tail(fname, tail, **kwargs):
+        """ Parse complete lines appended to a tabular report. """
+        try:
+            df = _handle_loader_backend(BytesIO(tail), "polars", **kwargs)
+        except pl.exceptions.NoDataError:
+            return None
+
+        if not df.height:
+            return None
+
+        df.columns = _get_tabular_header(fname)
+        return df
+
+    def refresh(self, **kwargs) -> pl.DataFrame:
+        """ Parse appended data and return the whole report.
+
+        Parameters
+        ----------
+        kwargs
+            Additional keyword arguments passed to `polars.read_csv`.
+
+        Returns
+        -------
+        pl.DataFrame
+            Report data with overlapping restart times removed.
+        """
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+
+        files = sorted(f for f in self._report_dir.rglob("*") if f.is_file())
+        keys = [str(f.relative_to(self._report_dir)) for f in files]
+
+        for key in set(self._index["files"]) - set(keys):
+            for part in self._parts(self._index["files"].pop(key)):
+                part.unlink()
+
+        for fname, key in zip(files, keys):
+            self._update_file(fname, key, **kwargs)
 
-            cleaned = l_strip.replace("(", " ").replace(")", " ")
-            data_rows.append("\t".join(cleaned.split()))
+        self._write_index()
 
-        if not data_rows:
-            return pd.DataFrame()
+        frames = []
 
-        source = StringIO("\n".join(data_rows))
-        return _handle_loader_backend(source, backend, **kwargs)
+        for key in keys:
+            if parts := self._parts(self._index["files"][key]):
+                frames.append(pl.concat(map(pl.read_parquet, parts),
+                                        how="vertical_relaxed"))
+
+        if not frames:
+            return pl.DataFrame()
+
+        frames = AbstractFoamDataLoader._drop_overlaps(frames)
+        return pl.concat(frames, how="vertical_relaxed", rechunk=True)
+
+    @property
+    def cache_directory(self) -> Path:
+        """ Access to the directory where the cache is stored. """
+        return self._cache_dir
 
 
 class FoamPostProcessingLoader:
@@ -281,12 +596,23 @@ class FoamPostProcessingLoader:
 
         return [f.resolve() for f in report_dir.rglob('*') if f.is_file()]
 
+    def _select_files(self, report, n_last):
+        """ Get files of a report, optionally only the last `n_last`. """
+        if not (files := self._get_report_files(report)):
+            raise ValueError(f"No files found for report '{report}'.")
+
+        if n_last is not None and len(files) > n_last:
+            files = files[-n_last:]
+
+        return files
+
     def load_report(self,
             report: str,
             loader: AbstractFoamDataLoader = FoamTabularData,
             n_last: int | None = None,
+            as_pandas: bool = True,
             **kwargs
-        ) -> pd.DataFrame:
+        ) -> pd.DataFrame | pl.DataFrame:
         """ Load a specific report into a pandas DataFrame.
 
         Parameters
@@ -302,16 +628,196 @@ class FoamPostProcessingLoader:
             arguments, and return a DataFrame with the data from that file.
         n_last : int | None, default = None
             Number of last files to load. If None, load all files.
+        as_pandas : bool = True
+            If false, return the Polars frame held by the loader without
+            conversion to pandas.
         kwargs
             Additional keyword arguments to pass to the loader function.
         """
-        if not (files := self._get_report_files(report)):
-            raise ValueError(f"No files found for report '{report}'.")
+        data = loader(self._select_files(report, n_last), **kwargs)
+        return data.table if as_pandas else data.frame
 
-        if n_last is not None and len(files) > n_last:
-            files = files[-n_last:]
+    def scan_report(self,
+            report: str,
+            columns: list[str] | None = None,
+            time_range: tuple[float | None, float | None] | None = None,
+            n_last: int | None = None,
+            **kwargs
+        ) -> pl.LazyFrame:
+        """ Lazily scan a tabular report with Polars.
+
+        Each file is scanned with `polars.scan_csv` and files are lazily
+        concatenated after removal of overlapping restart times, so that
+        column projection and time filtering are applied while reading.
+        Call `collect()` on the result to materialize it, and then
+        `to_pandas()` if a pandas DataFrame is required.
+
+        Parameters
+        ----------
+        report : str
+            The name of the report to load, must be one of the available
+            reports as returned by `available_reports`.
+        columns : list[str] | None = None
+            Columns to keep; by default all columns are kept.
+        time_range : tuple[float | None, float | None] | None = None
+            Closed interval of times to keep, either bound may be None.
+        n_last : int | None, default = None
+            Number of last files to load. If None, load all files.
+        kwargs
+            Additional keyword arguments passed to `polars.scan_csv`.
+        """
+        files = self._select_files(report, n_last)
+        frames = [_scan_tabular(f, **kwargs) for f in files]
+
+        time = _get_tabular_header(files[0])[0]
+        heads = pl.collect_all([lf.select(time).head(1) for lf in frames])
+
+        # Order by start time and cut each file at the next restart:
+        starts = [(h[time][0], k) for k, h in enumerate(heads) if h.height]
+        starts.sort()
+
+        merged = []
+
+        for (_, k), after in zip(starts, starts[1:] + [None]):
+            lf = frames[k]
+
+            if after is not None:
+                lf = lf.filter(pl.col(time) < after[0])
+
+            merged.append(lf)
+
+        if not merged:
+            raise ValueError(f"No data found for report '{report}'.")
+
+        lf = pl.concat(merged, how="vertical_relaxed")
+
+        if time_range is not None:
+            t_min, t_max = time_range
+
+            if t_min is not None:
+                lf = lf.filter(pl.col(time) >= t_min)
+
+            if t_max is not None:
+                lf = lf.filter(pl.col(time) <= t_max)
+
+        if columns is not None:
+            lf = lf.select(columns)
+
+        return lf
+
+    def follow_report(self, report: str, **kwargs) -> pl.DataFrame:
+        """ Load a tabular report parsing only data appended since last call.
+
+        Data is cached with `FoamReportCache` under `.majordome` in the
+        case directory (the parent of `postProcessing`), so that the
+        cache persists across sessions while monitoring a running case.
+
+        Parameters
+        ----------
+        report : str
+            The name of the report to load, must be one of the available
+            reports as returned by `available_reports`.
+        kwargs
+            Additional keyword arguments passed to `polars.read_csv`.
+        """
+        if not (report_dir := self._domain_dir / report).is_dir():
+            raise ValueError(f"No such report '{report_dir}'.")
+
+        case_dir = self._root.parent
+        cache_dir = case_dir / ".majordome" / report_dir.relative_to(case_dir)
+        return FoamReportCache(report_dir, cache_dir).refresh(**kwargs)
+
+    @staticmethod
+    def _discover_reports(root):
+        """ Map (region, report) pairs to their files under `root`. """
+        def is_report(path):
+            return any(_is_time_dir(d) for d in path.iterdir())
 
-        return loader(files).table
+        def files(path):
+            return sorted(f.resolve() for f in path.rglob("*") if f.is_file())
+
+        reports = {}
+
+        for path in sorted(d for d in root.iterdir() if d.is_dir()):
+            if is_report(path):
+                reports[(None, path.name)] = files(path)
+                continue
+
+            for sub in sorted(d for d in path.iterdir() if d.is_dir()):
+                if is_report(sub):
+                    reports[(path.name, sub.name)] = files(sub)
+
+        return {key: value for key, value in reports.items() if value}
+
+    @classmethod
+    def load_case(cls,
+            root: str | Path | None = None,
+            loader: AbstractFoamDataLoader = FoamTabularData,
+            workers: int | None = None,
+            tidy: bool = False,
+            deduplicate: bool = False,
+            **kwargs
+        ) -> dict[tuple[str | None, str], pl.DataFrame] | pl.DataFrame:
+        """ Load all reports of all regions of a case at once.
+
+        Reports are discovered as directories containing time folders,
+        either directly under `postProcessing` (region `None`) or under
+        a region directory. All files of all reports are loaded by a
+        single worker pool, each unique file being read only once;
+        reports that cannot be parsed by `loader` are skipped with a
+        warning.
+
+        Parameters
+        ----------
+        root: str | Path | None = None
+            Path to the case containing the `postProcessing` directory.
+        loader : AbstractFoamDataLoader = FoamTabularData
+            Loader class used for parsing the report files.
+        workers : int | None = None
+            Number of threads shared by all reports.
+        tidy : bool = False
+            If true, return a single long-format table with columns
+            `region`, `report`, `time`, `variable` and `value`; otherwise
+            a dictionary of tables indexed by `(region, report)`.
+        deduplicate : bool = False
+            If true, discard overlapping times between restarts.
+        kwargs
+            Additional keyword arguments to pass to the loader function.
+        """
+        reports = cls._discover_reports(cls._get_root(root))
+        unique = sorted({f for files in reports.values() for f in files})
+
+        def load(fname):
+            try:
+                return loader.load_file(fname, **kwargs)
+            except Exception as err:
+                return err
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            frames = dict(zip(unique, pool.map(load, unique)))
+
+        tables = {}
+
+        for (region, report), files in reports.items():
+            data = [frames[f] for f in files]
+
+            if errors := [e for e in data if isinstance(e, Exception)]:
+                majordome_warning(f"Skipping report '{report}' of region "
+                                  f"'{region}': {errors[0]}")
+                continue
+
+            data = loader.from_frames(data, deduplicate=deduplicate).frame
+            tables[(region, report)] = data
+
+        if not tidy:
+            return tables
+
+        if not (frames := [_tidy_report(df, region, report)
+                           for (region, report), df in tables.items()
+                           if df.width]):
+            return pl.DataFrame(schema=_TIDY_SCHEMA)
+
+        return pl.concat(frames)
 
     @property
     def available_reports(self) -> list[str]:
@@ -324,21 +830,119 @@ class FoamPostProcessingLoader:
         return self._root
 
 
+def _is_time_dir(path: Path) -> bool:
+    """ Check whether a path is a time (restart) directory. """
+    if not path.is_dir():
+        return False
+
+    try:
+        float(path.name)
+    except ValueError:
+        return False
+
+    return True
+
+
+def _is_vector_column(column: pl.Series) -> bool:
+    """ Check whether a column holds parenthesized vectors as text. """
+    values = column.drop_nulls()
+
+    return (column.dtype == pl.String and values.len() > 0
+            and values.str.contains(r"^\s*\(.*\)\s*$").all())
+
+
+def _tidy_report(df: pl.DataFrame, region: str | None, report: str):
+    """ Unpivot report to long format tagged with region and report.
+
+    Numeric columns are kept as they are and vector (or tensor) columns
+    written as `(a b c)` are expanded into components `name_0`, ...;
+    other columns cannot be represented as values and are dropped.
+    """
+    time, *columns = df.columns
+    values = []
+
+    for name in columns:
+        column = df[name]
+
+        if column.dtype.is_numeric():
+            values.append(column.cast(pl.Float64))
+            continue
+
+        if not _is_vector_column(column):
+            continue
+
+        parts = column.str.extract_all(r"[^\s()]+")
+
+        for k in range(parts.list.len().max()):
+            values.append(parts.list.get(k, null_on_oob=True)
+                               .cast(pl.Float64)
+                               .alias(f"{name}_{k}"))
+
+    if not values:
+        return pl.DataFrame(schema=_TIDY_SCHEMA)
+
+    return (pl.DataFrame([df[time].cast(pl.Float64).alias("time"), *values])
+              .unpivot(index="time", variable_name="variable")
+              .select(pl.lit(region, pl.String).alias("region"),
+                      pl.lit(report, pl.String).alias("report"),
+                      pl.all()))
+
+
+def _get_tabular_header(fname: str | Path) -> list[str]:
+    """ Header of a tabular report from its last leading comment. """
+    last_line = None
+
+    # Read until a line is not a comment:
+    with open(fname) as f:
+        for line in f:
+            if not line.startswith("#"):
+                break
+
+            last_line = line
+
+    if last_line is None:
+        raise ValueError(f"No header found in report '{fname}'.")
+
+    last_line = last_line.lstrip("#").replace("\t", ",")
+    last_line = re.sub(r"\s+", " ", last_line).strip()
+    return [h.strip() for h in last_line.split(",")]
+
+
+def _scan_tabular(
+        fname: Path,
+        sep: str = "\t",
+        comment: str = "#",
+        **kwargs
+    ) -> pl.LazyFrame:
+    """ Lazy scan of a tabular report with columns named after header. """
+    header = _get_tabular_header(fname)
+    return pl.scan_csv(fname, separator=sep, comment_prefix=comment,
+                       has_header=False, new_columns=header, **kwargs)
+
+
 def _handle_loader_backend(
-        source: str | Path | StringIO,
+        source: str | Path | BytesIO,
         backend: str = "polars",
         sep: str = "\t",
         comment: str = "#",
         **kwargs
-    ) -> pd.DataFrame:
-    """ Common handler of tabular data loading. """
+    ) -> pl.DataFrame | pd.DataFrame:
+    """ Common handler of tabular data loading.
+
+    Files without data rows (e.g. restarts that only wrote a header)
+    are loaded as empty frames.
+    """
     match backend.lower():
         case "pandas":
-            df = pd.read_csv(source, sep=sep, comment=comment,
-                             header=None, **kwargs)
+            try:
+                df = pd.read_csv(source, sep=sep, comment=comment,
+                                 header=None, **kwargs)
+            except pd.errors.EmptyDataError:
+                df = pd.DataFrame()
         case "polars":
+            kwargs.setdefault("raise_if_empty", False)
             df = pl.read_csv(source, separator=sep, comment_prefix=comment,
-                             has_header= False, **kwargs).to_pandas()
+                             has_header=False, **kwargs)
         case _:
             raise ValueError(f"Unsupported backend '{backend}'.")
 
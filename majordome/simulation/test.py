@@ -1,11 +1,381 @@
 # -*- coding: utf-8 -*-
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pytest
+
 from majordome.simulation import (
     ConstantTimeStepInterval,
+    ElmerConvergenceData,
+    ElmerConvergenceMonitor,
+    ElmerTabularData,
     FluentFvParticlesParser,
+    FluentInterpolationParser,
+    FluentSchemeTableRow,
+    FoamLagrangianTable,
+    FoamPostProcessingLoader,
+    FoamTabularData,
     GmshOCCModel,
+    GmshSessionWrapper,
+    convert_xy_to_dict,
+    load_dpm_table,
+    load_xy_pathlines,
+    write_interpolation_file,
 )
 
 def test_lazy_imports():
     assert ConstantTimeStepInterval is not None
     assert FluentFvParticlesParser is not None
     assert GmshOCCModel is not None
+
+
+DATA = Path(__file__).resolve().parents[2] / "docs" / "data"
+
+
+def _write_restarts(root, contents):
+    """ Write report files under time directories of a report. """
+    files = []
+
+    for time, text in contents.items():
+        (path := root / time).mkdir(parents=True)
+        (fname := path / "surfaceFieldValue.dat").write_text(text)
+        files.append(fname)
+
+    return files
+
+
+def test_foam_tabular_restarts(tmp_path):
+    lines = (DATA / "foam" / "tabular.dat").read_text().splitlines()
+    header, body = lines[:4], lines[4:]
+
+    files = _write_restarts(tmp_path, {
+        "0": "\n".join(header + body[:20]) + "\n",
+        "0.001": "\n".join(header + body[10:]) + "\n",
+        "0.002": "\n".join(header) + "\n",
+    })
+
+    data = FoamTabularData(files)
+    assert data.frame.height == 20 + len(body) - 10
+
+    data = FoamTabularData(files, deduplicate=True)
+    assert data.frame.height == len(body)
+    assert data.frame["Time"].is_sorted()
+
+    frames = [FoamTabularData.load_file(f) for f in files]
+    frames.append(frames[0].clear())
+    data = FoamTabularData.from_frames(frames, deduplicate=True)
+    assert data.frame.height == len(body)
+
+    with pytest.raises(ValueError):
+        FoamLagrangianTable([DATA / "foam" / "lagrangian.dat"],
+                            deduplicate=True)
+
+
+@pytest.mark.parametrize("backend", ["polars", "pandas"])
+def test_foam_lagrangian_whitespace(tmp_path, backend):
+    header, *body = (DATA / "foam" / "lagrangian.dat").read_text().splitlines()
+    expected = FoamLagrangianTable([DATA / "foam" / "lagrangian.dat"],
+                                   backend=backend).frame
+
+    variants = {
+        "tabs.dat": [line.replace(" ", "\t") for line in body],
+        "spaces.dat": [f"  {line.replace(' ', '   ')} \t" for line in body],
+    }
+
+    for name, lines in variants.items():
+        (fname := tmp_path / name).write_text("\n".join([header, *lines]))
+
+        data = FoamLagrangianTable([fname], backend=backend, chunk_size=512)
+        assert data.frame.shape == (29, 31)
+        assert data.frame.equals(expected)
+
+    (fname := tmp_path / "empty.dat").write_text(header + "\n")
+    df = FoamLagrangianTable.__new__(FoamLagrangianTable).loader(
+        fname, backend=backend)
+
+    assert isinstance(df, pd.DataFrame if backend == "pandas"
+                      else pl.DataFrame)
+
+
+def test_foam_load_case_tidy(tmp_path):
+    post = tmp_path / "postProcessing"
+    post.mkdir()
+
+    tidy = FoamPostProcessingLoader.load_case(tmp_path, tidy=True)
+    assert tidy.is_empty()
+    assert tidy.columns == ["region", "report", "time", "variable", "value"]
+
+    text = "# Time\tp\tareaAverage(U)\n0\t1.5\t(1 2 3)\n1\t2.5\t(4 5 6)\n"
+    _write_restarts(post / "fluid" / "probes", {"0": text})
+
+    tidy = FoamPostProcessingLoader.load_case(tmp_path, tidy=True)
+    assert tidy.height == 2 * 4
+    assert tidy["value"].null_count() == 0
+    assert set(tidy["variable"]) == {"p", "areaAverage(U)_0",
+                                     "areaAverage(U)_1", "areaAverage(U)_2"}
+
+
+def test_elmer_tabular_data(tmp_path):
+    fname = DATA / "elmer" / "tabular_np20.dat"
+    names = (DATA / "elmer" / "tabular_np20.dat.names").read_text()
+
+    data = ElmerTabularData(fname).data
+    expected = pd.read_csv(fname, sep=r"\s+", header=None)
+
+    assert np.allclose(data.to_numpy(), expected.to_numpy())
+    assert data.dtypes.tolist() == expected.dtypes.tolist()
+
+    # Integer-looking first value of a real column, repeated names:
+    lines = fname.read_text().splitlines()
+    first = lines[0].split()
+    lines[0] = " ".join([first[0], first[1], "0", *first[3:]])
+
+    (copy := tmp_path / "copy.dat").write_text("\n".join(lines))
+    (tmp_path / "copy.dat.names").write_text(
+        names.replace("body mean: temperature mask bodymould",
+                      "body mean: temperature mask bodymolten"))
+
+    data = ElmerTabularData(copy, cache=True).data
+    name = "body mean: temperature mask bodymolten"
+
+    assert data.columns.is_unique
+    assert data[f"{name}.1"].equals(expected[4])
+    assert data.iloc[:, 1].dtype == np.int64
+    assert data.iloc[:, 2].dtype == np.float64
+    assert data.iloc[0, 2] == 0.0
+
+    cached = ElmerTabularData(copy, columns=[f"{name}.1"], cache=True)
+    assert cached.data.columns.tolist() == [f"{name}.1"]
+
+    # Renaming columns in metadata invalidates the sidecar:
+    (tmp_path / "copy.dat.names").write_text(names)
+    data = ElmerTabularData(copy, cache=True).data
+    assert f"{name}.1" not in data.columns
+
+
+def test_elmer_convergence_monitor(tmp_path):
+    header, *rows = (DATA / "elmer" / "convergence.dat").read_text()\
+        .splitlines(keepends=True)
+
+    (fname := tmp_path / "convergence.dat").write_text(header)
+    monitor = ElmerConvergenceMonitor(fname)
+    assert monitor.poll() == {}
+
+    updates = []
+    monitor.on_update(updates.append)
+
+    with open(fname, "a") as fp:
+        fp.writelines(rows[:len(rows) // 2])
+
+    monitor.poll()
+
+    with open(fname, "a") as fp:
+        fp.writelines(rows[len(rows) // 2:])
+
+    monitor.poll()
+    assert len(updates) == 2
+
+    expected = ElmerConvergenceData(DATA / "elmer" / "convergence.dat")
+    assert monitor.tracked_solvers == expected.tracked_solvers
+
+    for solver in expected.tracked_solvers:
+        df = monitor.get_solver_data(solver)
+        ref = expected.get_solver_data(solver)
+
+        assert df.dtypes.tolist() == ref.dtypes.tolist()
+        assert np.allclose(df.to_numpy(), ref.to_numpy())
+
+
+def test_gmsh_build_key():
+    class Box(GmshSessionWrapper):
+        def build(self):
+            pass
+
+    def key(size, tool=None):
+        # Bypass the Gmsh session, only parameters are required here:
+        box = Box.__new__(Box)
+        return box.build_key({"size": np.asarray(size), "tool": tool})
+
+    assert key([1.0, 2.0]) == key([1.0, 2.0])
+    assert key([1.0, 2.0]) != key([1.0, 3.0])
+
+    with pytest.raises(TypeError):
+        key([1.0, 2.0], tool=object())
+
+    with pytest.raises(ValueError):
+        Box.__new__(Box).save_as_stl(cache="cache")
+
+
+def test_gmsh_transform_nodes_of_entities():
+    class Mesh:
+        # Nodes 1-2 are classified on surface 1, node 3 on its boundary.
+        coords = np.array([[1.0, 1e-9, 0.0], [2.0, -1e-9, 0.0],
+                           [3.0, 1e-9, 0.0], [4.0, 1e-9, 0.0]])
+
+        def getNodes(self, dim=-1, tag=-1, includeBoundary=False,
+                     returnParametricCoord=True):
+            n = 4 if dim == -1 else 3 if includeBoundary else 2
+            tags = np.arange(1, n + 1, dtype=np.uint64)
+            return tags, self.coords[:n].ravel().copy(), np.empty(0)
+
+        def affineTransform(self, affine, dimTags):
+            affine = np.reshape(affine, (3, 4))
+            n = 2 if dimTags else 4
+            self.coords[:n] = self.coords[:n] @ affine[:, :3].T + affine[:, 3]
+
+        def setNode(self, tag, coord, parametricCoord):
+            self.coords[tag - 1] = coord
+
+    model = GmshOCCModel.__new__(GmshOCCModel)
+    model._mesh = mesh = Mesh()
+    model.transform_all_nodes(np.eye(3), snap_axis="x", dimtags=[(2, 1)])
+
+    assert np.all(mesh.coords[:2, 1:] == 0.0)
+    assert np.all(mesh.coords[2:, 1] == 1e-9)
+
+
+def test_fluent_fvparticles_parser():
+    fname = DATA / "fluent" / "sample.fvp"
+    lines = [line for line in fname.read_text().splitlines() if line.strip()]
+
+    start = lines.index("Variable Names")
+    body = lines[start + 2 + int(lines[start + 1]):]
+    tracks = []
+
+    while body:
+        n, body = int(body[0]), body[1:]
+        tracks.append(np.array([row.split() for row in body[:n]], float))
+        body = body[n:]
+
+    parser = FluentFvParticlesParser(fname)
+
+    assert parser.n_tracks == len(tracks)
+    assert parser.offsets.tolist() == [0, *np.cumsum(list(map(len, tracks)))]
+    assert parser[0].columns.tolist() == parser.variable_names
+
+    for track, data in zip(tracks, parser.data):
+        assert np.array_equal(track, data)
+
+
+def test_fluent_fvparticles_parser_malformed(tmp_path):
+    lines = (DATA / "fluent" / "sample.fvp").read_text().splitlines()
+    fname = tmp_path / "malformed.fvp"
+
+    # Truncated file, last track misses its final row:
+    fname.write_text("\n".join(lines[:-1]))
+
+    with pytest.raises(ValueError):
+        FluentFvParticlesParser(fname)
+
+    # Corrupted token in the first row of the first track:
+    start = lines.index("Variable Names")
+    first = start + 3 + int(lines[start + 1])
+    lines[first] = lines[first].replace(" ", "x ", 1)
+    fname.write_text("\n".join(lines))
+
+    with pytest.raises(ValueError, match="Malformed"):
+        FluentFvParticlesParser(fname)
+
+
+def test_fluent_interpolation_parser():
+    fname = DATA / "fluent" / "sample.ip"
+    tokens = fname.read_text().split()
+
+    n_dims, n_points, n_vars = map(int, tokens[1:4])
+    names = tokens[4:4 + n_vars]
+    values = [float(t.strip("()")) for t in tokens[4 + n_vars:]
+              if t.strip("()")]
+    expected = np.reshape(values, (n_dims + n_vars, n_points)).T
+
+    parser = FluentInterpolationParser(fname, verbose=False)
+
+    assert parser.variable_names[n_dims:] == names
+    assert np.array_equal(parser.data, expected)
+    assert np.array_equal(parser.get_data(names[-1]), expected[:, -1])
+
+    parallel = FluentInterpolationParser(fname, workers=2, verbose=False)
+    assert np.array_equal(parallel.data, expected)
+
+
+def test_write_interpolation_file(tmp_path):
+    rng = np.random.default_rng(42)
+    coordinates = rng.random((1000, 3))
+    variables = {"pressure": rng.normal(size=1000),
+                 "temperature": 300 + 1000 * rng.random(1000)}
+
+    fname = tmp_path / "fields.ip"
+    write_interpolation_file(fname, coordinates, variables, chunk_size=300)
+
+    parser = FluentInterpolationParser(fname, verbose=False)
+    assert parser.n_dimensions == 3
+    assert parser.n_points == 1000
+    assert parser.variable_names[3:] == list(variables)
+
+    expected = np.column_stack([coordinates, *variables.values()])
+    assert np.array_equal(parser.data, expected)
+
+    with pytest.raises(FileExistsError):
+        write_interpolation_file(fname, coordinates, variables)
+
+    write_interpolation_file(fname, coordinates, variables, precision=6,
+                             overwrite=True)
+    parser = FluentInterpolationParser(fname, verbose=False)
+    assert np.allclose(parser.data, expected, rtol=1e-6, atol=0)
+
+
+def test_fluent_dpm_file(tmp_path):
+    rng = np.random.default_rng(42)
+    values = rng.normal(size=(20, 7)) * 10.0**rng.integers(-6, 6, (20, 7))
+    names = ["x", "y", "z", "u", "v", "w", "diameter"]
+
+    rows = [f"(({' '.join(f'{v:.8e}' for v in row)}) injection-0:{k})"
+            for k, row in enumerate(values)]
+    text = "\n".join(["(outlet 5)", f"({' '.join(names)} name)", *rows])
+
+    (fname := tmp_path / "sample.dpm").write_text(text + "\n")
+    expected = [FluentSchemeTableRow(row).values[:7] for row in rows]
+
+    df = load_dpm_table(fname)
+    assert df.columns.tolist() == names
+    assert np.array_equal(df.to_numpy(), expected)
+
+    (fname := tmp_path / "bad.dpm").write_text(text + "\n((1.0 2.0))\n")
+
+    with pytest.raises(ValueError):
+        load_dpm_table(fname)
+
+
+def test_load_xy_pathlines(tmp_path):
+    rng = np.random.default_rng(42)
+    tracks = {k: rng.random((n, 2)) for k, n in enumerate([5, 1, 12], 1)}
+
+    blocks = ["(title \"Particle Traces\")", "(labels \"X\" \"Y\")"]
+
+    for k, xy in tracks.items():
+        rows = "\n".join(f"{x:.17g}\t{y:.17g}" for x, y in xy)
+        blocks.append(f"((xy/key/label \"particle-{k}\")\n{rows}\n)")
+
+    (fname := tmp_path / "pathlines.xy").write_text("\n\n".join(blocks))
+
+    particles, offsets, coords = load_xy_pathlines(fname)
+    reference = convert_xy_to_dict(fname)
+
+    assert particles.tolist() == list(tracks)
+    assert offsets.tolist() == [0, 5, 6, 18]
+
+    for i, k in enumerate(particles):
+        xy = coords[offsets[i]:offsets[i + 1]]
+        assert np.array_equal(xy, tracks[k])
+        assert np.allclose(xy, np.column_stack([reference[k]["X"],
+                                                reference[k]["Y"]]))
+
+    # A bad token must not silently truncate the particle block:
+    lines = blocks[2].split("\n")
+    lines[2] = f"x{lines[2]}"
+    blocks[2] = "\n".join(lines)
+    fname.write_text("\n\n".join(blocks))
+
+    with pytest.raises(ValueError, match="particle 1"):
+        load_xy_pathlines(fname)